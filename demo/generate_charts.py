@@ -3,15 +3,29 @@ Generate comparison charts for demo materials.
 
 Per judge recommendations: "Add one killer chart: feasibility ↑, optimality ↑,
 token length ↓ (baseline → SFT → GRPO)."
+
+Each chart is built by an independent function so the four figures can be
+rendered (and PNG-encoded) concurrently in separate worker processes.
+
+Run with ``--draft`` to skip matplotlib entirely and rasterize simplified bar
+charts directly with NumPy + Pillow (quick previews while iterating on data).
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
+import argparse
+import multiprocessing
 from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+# Optional fast PNG encoder (pip install pyspng-seunglab); falls back to savefig
+try:
+    import pyspng
+except ImportError:
+    pyspng = None
 
-# Create output directory
+# Output directory
 output_dir = Path("demo/charts")
-output_dir.mkdir(parents=True, exist_ok=True)
 
 # Data for baseline → SFT → GRPO progression
 models = ['Baseline\nGemma-2b', 'After SFT', 'After GRPO\n(Final)']
@@ -20,147 +34,443 @@ feasibility = [45, 80, 95]
 optimality = [20, 70, 90]
 avg_tokens = [350, 280, 250]
 
-# Chart 1: Killer Chart - All Metrics
-fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
-fig.suptitle('Proof-Carrying Reasoner: Training Progression', fontsize=16, fontweight='bold')
-
-x = np.arange(len(models))
-width = 0.6
-
-# Format Accuracy
-bars1 = ax1.bar(x, format_accuracy, width, color=['#e74c3c', '#f39c12', '#27ae60'])
-ax1.set_ylabel('Format Accuracy (%)', fontsize=12)
-ax1.set_title('Format Compliance ↑', fontsize=13, fontweight='bold')
-ax1.set_xticks(x)
-ax1.set_xticklabels(models)
-ax1.set_ylim(0, 110)
-ax1.grid(axis='y', alpha=0.3)
-for i, v in enumerate(format_accuracy):
-    ax1.text(i, v + 3, f'{v}%', ha='center', fontweight='bold')
-
-# Feasibility
-bars2 = ax2.bar(x, feasibility, width, color=['#e74c3c', '#f39c12', '#27ae60'])
-ax2.set_ylabel('Feasibility Rate (%)', fontsize=12)
-ax2.set_title('Feasibility ↑', fontsize=13, fontweight='bold')
-ax2.set_xticks(x)
-ax2.set_xticklabels(models)
-ax2.set_ylim(0, 110)
-ax2.grid(axis='y', alpha=0.3)
-for i, v in enumerate(feasibility):
-    ax2.text(i, v + 3, f'{v}%', ha='center', fontweight='bold')
-
-# Optimality
-bars3 = ax3.bar(x, optimality, width, color=['#e74c3c', '#f39c12', '#27ae60'])
-ax3.set_ylabel('Optimality Rate (%)', fontsize=12)
-ax3.set_title('Optimality ↑', fontsize=13, fontweight='bold')
-ax3.set_xticks(x)
-ax3.set_xticklabels(models)
-ax3.set_ylim(0, 110)
-ax3.grid(axis='y', alpha=0.3)
-for i, v in enumerate(optimality):
-    ax3.text(i, v + 3, f'{v}%', ha='center', fontweight='bold')
-
-# Token Length (inverted - lower is better)
-bars4 = ax4.bar(x, avg_tokens, width, color=['#e74c3c', '#f39c12', '#27ae60'])
-ax4.set_ylabel('Average Tokens', fontsize=12)
-ax4.set_title('Token Length ↓ (Lower is Better)', fontsize=13, fontweight='bold')
-ax4.set_xticks(x)
-ax4.set_xticklabels(models)
-ax4.set_ylim(0, 400)
-ax4.grid(axis='y', alpha=0.3)
-for i, v in enumerate(avg_tokens):
-    ax4.text(i, v + 10, f'{v}', ha='center', fontweight='bold')
-
-plt.tight_layout()
-plt.savefig(output_dir / 'killer_chart.png', dpi=300, bbox_inches='tight')
-print(f"✓ Saved: {output_dir / 'killer_chart.png'}")
-
-# Chart 2: Comparison Bar Chart
-fig, ax = plt.subplots(figsize=(12, 6))
-
-x = np.arange(len(models))
-width = 0.2
-
-bars1 = ax.bar(x - width*1.5, format_accuracy, width, label='Format', color='#3498db')
-bars2 = ax.bar(x - width*0.5, feasibility, width, label='Feasibility', color='#2ecc71')
-bars3 = ax.bar(x + width*0.5, optimality, width, label='Optimality', color='#9b59b6')
-bars4 = ax.bar(x + width*1.5, [t/4 for t in avg_tokens], width, label='Tokens (÷4)', color='#e67e22')
-
-ax.set_ylabel('Percentage / Score', fontsize=12)
-ax.set_title('Training Progression: All Metrics', fontsize=14, fontweight='bold')
-ax.set_xticks(x)
-ax.set_xticklabels(models)
-ax.legend(loc='upper left', fontsize=11)
-ax.set_ylim(0, 110)
-ax.grid(axis='y', alpha=0.3)
-
-plt.tight_layout()
-plt.savefig(output_dir / 'comparison_bars.png', dpi=300, bbox_inches='tight')
-print(f"✓ Saved: {output_dir / 'comparison_bars.png'}")
-
-# Chart 3: Line Chart - Progression
-fig, ax = plt.subplots(figsize=(10, 6))
-
-ax.plot(models, format_accuracy, marker='o', linewidth=2, markersize=8, label='Format', color='#3498db')
-ax.plot(models, feasibility, marker='s', linewidth=2, markersize=8, label='Feasibility', color='#2ecc71')
-ax.plot(models, optimality, marker='^', linewidth=2, markersize=8, label='Optimality', color='#9b59b6')
-
-ax.set_ylabel('Accuracy (%)', fontsize=12)
-ax.set_title('Quality Metrics: Training Progression', fontsize=14, fontweight='bold')
-ax.legend(loc='lower right', fontsize=11)
-ax.set_ylim(0, 110)
-ax.grid(True, alpha=0.3)
-
-# Add value labels
-for i, (f, fe, o) in enumerate(zip(format_accuracy, feasibility, optimality)):
-    ax.text(i, f + 2, f'{f}%', ha='center', fontsize=9)
-    ax.text(i, fe + 2, f'{fe}%', ha='center', fontsize=9)
-    ax.text(i, o + 2, f'{o}%', ha='center', fontsize=9)
-
-plt.tight_layout()
-plt.savefig(output_dir / 'progression_line.png', dpi=300, bbox_inches='tight')
-print(f"✓ Saved: {output_dir / 'progression_line.png'}")
-
-# Chart 4: Verification Success Rate
-fig, ax = plt.subplots(figsize=(8, 6))
-
-categories = ['Format\nValid', 'Feasible', 'Optimal', 'Fully\nVerified']
-baseline_scores = [30, 45, 20, 15]
-final_scores = [100, 95, 90, 90]
-
-x = np.arange(len(categories))
-width = 0.35
-
-bars1 = ax.bar(x - width/2, baseline_scores, width, label='Baseline', color='#e74c3c', alpha=0.8)
-bars2 = ax.bar(x + width/2, final_scores, width, label='Our Model', color='#27ae60', alpha=0.8)
-
-ax.set_ylabel('Success Rate (%)', fontsize=12)
-ax.set_title('Verification Success: Baseline vs Our Model', fontsize=14, fontweight='bold')
-ax.set_xticks(x)
-ax.set_xticklabels(categories)
-ax.legend(fontsize=11)
-ax.set_ylim(0, 110)
-ax.grid(axis='y', alpha=0.3)
-
-# Add value labels
-for i, (b, f) in enumerate(zip(baseline_scores, final_scores)):
-    ax.text(i - width/2, b + 2, f'{b}%', ha='center', fontsize=9, fontweight='bold')
-    ax.text(i + width/2, f + 2, f'{f}%', ha='center', fontsize=9, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig(output_dir / 'verification_comparison.png', dpi=300, bbox_inches='tight')
-print(f"✓ Saved: {output_dir / 'verification_comparison.png'}")
-
-print()
-print("=" * 60)
-print("✅ ALL CHARTS GENERATED SUCCESSFULLY")
-print("=" * 60)
-print(f"Output directory: {output_dir}")
-print()
-print("Charts created:")
-print("  1. killer_chart.png - 4-panel progression chart")
-print("  2. comparison_bars.png - Grouped bar comparison")
-print("  3. progression_line.png - Line chart showing improvement")
-print("  4. verification_comparison.png - Baseline vs final")
-print()
+# PNG encoding dominates savefig at dpi=300; zlib level 1 trades ~10-15% larger
+# files for a much faster encode, which is fine for demo charts.
+SAVEFIG_KWARGS = {
+    "dpi": 300,
+    "bbox_inches": "tight",
+    "pil_kwargs": {"compress_level": 1},
+}
+PNG_COMPRESS_LEVEL = SAVEFIG_KWARGS["pil_kwargs"]["compress_level"]
+PAD_INCHES = 0.1  # matches savefig's default padding around a tight bbox
+
+
+def _pyplot():
+    """Import pyplot lazily with the non-interactive Agg backend (no GUI init)."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def write_png(canvas: np.ndarray, path: Path) -> None:
+    """Encode an RGBA uint8 array as PNG (pyspng if available, else Pillow)."""
+    if pyspng is not None:
+        Path(path).write_bytes(pyspng.encode(canvas, compress_level=PNG_COMPRESS_LEVEL))
+    else:
+        from PIL import Image
+
+        Image.fromarray(canvas).save(path, compress_level=PNG_COMPRESS_LEVEL)
+
+
+def save_png(fig, path: Path) -> None:
+    """
+    Save a figure as PNG.
+
+    With pyspng available, the Agg canvas is rendered once, cropped to the tight
+    bounding box straight from the RGBA buffer (no copy through matplotlib's
+    PNG writer) and encoded by libspng. Otherwise defers to ``savefig`` with an
+    explicit bounding box measured by one render-free draw, so matplotlib does
+    not rasterize the figure a second time to find ``bbox_inches='tight'``.
+    """
+    dpi = SAVEFIG_KWARGS["dpi"]
+    fig.set_dpi(dpi)
+
+    if pyspng is None:
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox().padded(PAD_INCHES)
+        fig.savefig(path, **{**SAVEFIG_KWARGS, "bbox_inches": bbox})
+        return
+
+    fig.canvas.draw()
+    buf = np.asarray(fig.canvas.buffer_rgba())
+
+    # Tight bbox is in inches from the bottom-left; buffer rows start at the top
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(PAD_INCHES)
+    height, width = buf.shape[:2]
+    x0 = max(int(bbox.x0 * dpi), 0)
+    x1 = min(int(np.ceil(bbox.x1 * dpi)), width)
+    top = max(height - int(np.ceil(bbox.y1 * dpi)), 0)
+    bottom = min(height - int(bbox.y0 * dpi), height)
+
+    write_png(np.ascontiguousarray(buf[top:bottom, x0:x1]), path)
+
+
+def build_killer_chart(path: Path) -> None:
+    """Chart 1: Killer Chart - All Metrics."""
+    plt = _pyplot()
+
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+    fig.suptitle('Proof-Carrying Reasoner: Training Progression', fontsize=16, fontweight='bold')
+
+    x = np.arange(len(models))
+    width = 0.6
+
+    # Format Accuracy
+    ax1.bar(x, format_accuracy, width, color=['#e74c3c', '#f39c12', '#27ae60'])
+    ax1.set_ylabel('Format Accuracy (%)', fontsize=12)
+    ax1.set_title('Format Compliance ↑', fontsize=13, fontweight='bold')
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(models)
+    ax1.set_ylim(0, 110)
+    ax1.grid(axis='y', alpha=0.3)
+    for i, v in enumerate(format_accuracy):
+        ax1.text(i, v + 3, f'{v}%', ha='center', fontweight='bold')
+
+    # Feasibility
+    ax2.bar(x, feasibility, width, color=['#e74c3c', '#f39c12', '#27ae60'])
+    ax2.set_ylabel('Feasibility Rate (%)', fontsize=12)
+    ax2.set_title('Feasibility ↑', fontsize=13, fontweight='bold')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(models)
+    ax2.set_ylim(0, 110)
+    ax2.grid(axis='y', alpha=0.3)
+    for i, v in enumerate(feasibility):
+        ax2.text(i, v + 3, f'{v}%', ha='center', fontweight='bold')
+
+    # Optimality
+    ax3.bar(x, optimality, width, color=['#e74c3c', '#f39c12', '#27ae60'])
+    ax3.set_ylabel('Optimality Rate (%)', fontsize=12)
+    ax3.set_title('Optimality ↑', fontsize=13, fontweight='bold')
+    ax3.set_xticks(x)
+    ax3.set_xticklabels(models)
+    ax3.set_ylim(0, 110)
+    ax3.grid(axis='y', alpha=0.3)
+    for i, v in enumerate(optimality):
+        ax3.text(i, v + 3, f'{v}%', ha='center', fontweight='bold')
+
+    # Token Length (inverted - lower is better)
+    ax4.bar(x, avg_tokens, width, color=['#e74c3c', '#f39c12', '#27ae60'])
+    ax4.set_ylabel('Average Tokens', fontsize=12)
+    ax4.set_title('Token Length ↓ (Lower is Better)', fontsize=13, fontweight='bold')
+    ax4.set_xticks(x)
+    ax4.set_xticklabels(models)
+    ax4.set_ylim(0, 400)
+    ax4.grid(axis='y', alpha=0.3)
+    for i, v in enumerate(avg_tokens):
+        ax4.text(i, v + 10, f'{v}', ha='center', fontweight='bold')
+
+    plt.tight_layout()
+    save_png(fig, path)
+    plt.close(fig)
+
+
+def build_comparison_bars(path: Path) -> None:
+    """Chart 2: Comparison Bar Chart."""
+    plt = _pyplot()
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    x = np.arange(len(models))
+    width = 0.2
+
+    ax.bar(x - width*1.5, format_accuracy, width, label='Format', color='#3498db')
+    ax.bar(x - width*0.5, feasibility, width, label='Feasibility', color='#2ecc71')
+    ax.bar(x + width*0.5, optimality, width, label='Optimality', color='#9b59b6')
+    ax.bar(x + width*1.5, [t/4 for t in avg_tokens], width, label='Tokens (÷4)', color='#e67e22')
+
+    ax.set_ylabel('Percentage / Score', fontsize=12)
+    ax.set_title('Training Progression: All Metrics', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(models)
+    ax.legend(loc='upper left', fontsize=11)
+    ax.set_ylim(0, 110)
+    ax.grid(axis='y', alpha=0.3)
+
+    plt.tight_layout()
+    save_png(fig, path)
+    plt.close(fig)
+
+
+def build_progression_line(path: Path) -> None:
+    """Chart 3: Line Chart - Progression."""
+    plt = _pyplot()
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    ax.plot(models, format_accuracy, marker='o', linewidth=2, markersize=8, label='Format', color='#3498db')
+    ax.plot(models, feasibility, marker='s', linewidth=2, markersize=8, label='Feasibility', color='#2ecc71')
+    ax.plot(models, optimality, marker='^', linewidth=2, markersize=8, label='Optimality', color='#9b59b6')
+
+    ax.set_ylabel('Accuracy (%)', fontsize=12)
+    ax.set_title('Quality Metrics: Training Progression', fontsize=14, fontweight='bold')
+    ax.legend(loc='lower right', fontsize=11)
+    ax.set_ylim(0, 110)
+    ax.grid(True, alpha=0.3)
+
+    # Add value labels
+    for i, (f, fe, o) in enumerate(zip(format_accuracy, feasibility, optimality)):
+        ax.text(i, f + 2, f'{f}%', ha='center', fontsize=9)
+        ax.text(i, fe + 2, f'{fe}%', ha='center', fontsize=9)
+        ax.text(i, o + 2, f'{o}%', ha='center', fontsize=9)
+
+    plt.tight_layout()
+    save_png(fig, path)
+    plt.close(fig)
+
+
+def build_verification_comparison(path: Path) -> None:
+    """Chart 4: Verification Success Rate."""
+    plt = _pyplot()
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+
+    categories = ['Format\nValid', 'Feasible', 'Optimal', 'Fully\nVerified']
+    baseline_scores = [30, 45, 20, 15]
+    final_scores = [100, 95, 90, 90]
+
+    x = np.arange(len(categories))
+    width = 0.35
+
+    ax.bar(x - width/2, baseline_scores, width, label='Baseline', color='#e74c3c', alpha=0.8)
+    ax.bar(x + width/2, final_scores, width, label='Our Model', color='#27ae60', alpha=0.8)
+
+    ax.set_ylabel('Success Rate (%)', fontsize=12)
+    ax.set_title('Verification Success: Baseline vs Our Model', fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories)
+    ax.legend(fontsize=11)
+    ax.set_ylim(0, 110)
+    ax.grid(axis='y', alpha=0.3)
+
+    # Add value labels
+    for i, (b, f) in enumerate(zip(baseline_scores, final_scores)):
+        ax.text(i - width/2, b + 2, f'{b}%', ha='center', fontsize=9, fontweight='bold')
+        ax.text(i + width/2, f + 2, f'{f}%', ha='center', fontsize=9, fontweight='bold')
+
+    plt.tight_layout()
+    save_png(fig, path)
+    plt.close(fig)
+
+
+# ---------------------------------------------------------------------------
+# Draft mode: direct raster composition (no matplotlib)
+# ---------------------------------------------------------------------------
+
+WHITE = (255, 255, 255, 255)
+BLACK = (0, 0, 0, 255)
+GRID = (225, 225, 225, 255)
+
+
+def _rgba(hex_color: str) -> tuple:
+    """Convert '#rrggbb' to an RGBA tuple."""
+    h = hex_color.lstrip("#")
+    return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16), 255)
+
+
+def render_bar_chart(
+    series: Sequence[Sequence[float]],
+    labels: Sequence[str],
+    title: str,
+    colors: Sequence[str],
+    ymax: float,
+    legend: Optional[Sequence[str]] = None,
+    bar_colors: Optional[Sequence[str]] = None,
+    value_fmt: str = "{:g}",
+    size: tuple = (1200, 700),
+) -> np.ndarray:
+    """
+    Rasterize a (grouped) bar chart into an RGBA array.
+
+    Bars, axes and gridlines are filled with NumPy slice assignment; only text
+    goes through Pillow's ImageDraw.
+
+    Args:
+        series: One list of values per series, each aligned with ``labels``
+        labels: Group labels along the x axis (may contain newlines)
+        title: Chart title
+        colors: One color per series
+        ymax: Upper limit of the y axis
+        legend: Optional series names drawn as a legend
+        bar_colors: Per-group colors (single-series charts only)
+        value_fmt: Format string for the value printed above each bar
+        size: Canvas (width, height) in pixels
+
+    Returns:
+        uint8 array of shape (height, width, 4)
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    width, height = size
+    left, right, top, bottom = 90, 30, 70, 90
+    plot_w, plot_h = width - left - right, height - top - bottom
+    y_base = top + plot_h
+
+    canvas = np.empty((height, width, 4), dtype=np.uint8)
+    canvas[:] = WHITE
+
+    def y_px(value: float) -> int:
+        return y_base - int(round(plot_h * min(value, ymax) / ymax))
+
+    # Horizontal gridlines
+    tick_step = 20 if ymax <= 200 else 100
+    ticks = np.arange(0, ymax + 1e-9, tick_step)
+    for tick in ticks[1:]:
+        canvas[y_px(tick), left:left + plot_w] = GRID
+
+    # Bars
+    n_groups, n_series = len(labels), len(series)
+    group_w = plot_w / n_groups
+    bar_w = group_w * 0.8 / n_series
+    bar_boxes = []
+    for s_idx, values in enumerate(series):
+        for g_idx, value in enumerate(values):
+            x0 = int(left + g_idx * group_w + group_w * 0.1 + s_idx * bar_w)
+            x1 = int(x0 + bar_w) - 1
+            y0 = y_px(value)
+            color = bar_colors[g_idx] if bar_colors else colors[s_idx]
+            canvas[y0:y_base, x0:x1] = _rgba(color)
+            bar_boxes.append(((x0 + x1) // 2, y0, value))
+
+    # Axes
+    canvas[top:y_base + 1, left - 2:left] = BLACK
+    canvas[y_base:y_base + 2, left - 2:left + plot_w] = BLACK
+
+    # Text
+    img = Image.fromarray(canvas)
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default(size=18)
+    title_font = ImageFont.load_default(size=26)
+
+    draw.text((width // 2, top // 2), title, fill=BLACK, font=title_font, anchor="mm")
+    for tick in ticks:
+        draw.text((left - 8, y_px(tick)), f"{tick:g}", fill=BLACK, font=font, anchor="rm")
+    for g_idx, label in enumerate(labels):
+        cx = left + (g_idx + 0.5) * group_w
+        draw.multiline_text((cx, y_base + 10), label, fill=BLACK, font=font, anchor="ma", align="center")
+    for cx, y0, value in bar_boxes:
+        draw.text((cx, y0 - 4), value_fmt.format(value), fill=BLACK, font=font, anchor="mb")
+
+    if legend:
+        for s_idx, name in enumerate(legend):
+            ly = top + 10 + s_idx * 26
+            draw.rectangle((left + 12, ly, left + 32, ly + 16), fill=_rgba(colors[s_idx]))
+            draw.text((left + 40, ly + 8), name, fill=BLACK, font=font, anchor="lm")
+
+    return np.asarray(img)
+
+
+def draw_bar_chart(
+    values: Sequence[float],
+    labels: Sequence[str],
+    title: str,
+    outpath: Path,
+    colors: Sequence[str] = ('#3498db',),
+    ymax: float = 110,
+    **kwargs,
+) -> None:
+    """Rasterize a single-series bar chart and write it to ``outpath``."""
+    write_png(render_bar_chart([values], labels, title, colors, ymax, **kwargs), outpath)
+
+
+_STAGE_COLORS = ['#e74c3c', '#f39c12', '#27ae60']
+_SERIES_COLORS = ['#3498db', '#2ecc71', '#9b59b6', '#e67e22']
+
+
+def draft_killer_chart(path: Path) -> None:
+    """Chart 1 (draft): 2x2 panel grid composed from four raster bar charts."""
+    panel = dict(labels=models, colors=_STAGE_COLORS[:1], bar_colors=_STAGE_COLORS, size=(700, 500))
+    panels: List[np.ndarray] = [
+        render_bar_chart([format_accuracy], title='Format Compliance (higher is better)',
+                         ymax=110, value_fmt='{}%', **panel),
+        render_bar_chart([feasibility], title='Feasibility (higher is better)',
+                         ymax=110, value_fmt='{}%', **panel),
+        render_bar_chart([optimality], title='Optimality (higher is better)',
+                         ymax=110, value_fmt='{}%', **panel),
+        render_bar_chart([avg_tokens], title='Token Length (lower is better)',
+                         ymax=400, **panel),
+    ]
+    write_png(np.vstack([np.hstack(panels[:2]), np.hstack(panels[2:])]), path)
+
+
+def draft_comparison_bars(path: Path) -> None:
+    """Chart 2 (draft): grouped bars of all metrics."""
+    write_png(render_bar_chart(
+        [format_accuracy, feasibility, optimality, [t / 4 for t in avg_tokens]],
+        models, 'Training Progression: All Metrics', _SERIES_COLORS, 110,
+        legend=['Format', 'Feasibility', 'Optimality', 'Tokens (/4)'],
+    ), path)
+
+
+def draft_progression_line(path: Path) -> None:
+    """Chart 3 (draft): quality metrics per stage, drawn as grouped bars."""
+    write_png(render_bar_chart(
+        [format_accuracy, feasibility, optimality],
+        models, 'Quality Metrics: Training Progression', _SERIES_COLORS[:3], 110,
+        legend=['Format', 'Feasibility', 'Optimality'], value_fmt='{}%',
+    ), path)
+
+
+def draft_verification_comparison(path: Path) -> None:
+    """Chart 4 (draft): baseline vs final verification success."""
+    write_png(render_bar_chart(
+        [[30, 45, 20, 15], [100, 95, 90, 90]],
+        ['Format\nValid', 'Feasible', 'Optimal', 'Fully\nVerified'],
+        'Verification Success: Baseline vs Our Model', ['#e74c3c', '#27ae60'], 110,
+        legend=['Baseline', 'Our Model'], value_fmt='{}%',
+    ), path)
+
+
+# Chart number -> (builder, output filename)
+CHARTS = {
+    1: (build_killer_chart, 'killer_chart.png'),
+    2: (build_comparison_bars, 'comparison_bars.png'),
+    3: (build_progression_line, 'progression_line.png'),
+    4: (build_verification_comparison, 'verification_comparison.png'),
+}
+DRAFT_BUILDERS = {
+    1: draft_killer_chart,
+    2: draft_comparison_bars,
+    3: draft_progression_line,
+    4: draft_verification_comparison,
+}
+
+
+def _dispatch(job: tuple) -> Path:
+    """Worker entry point: build a single chart and return its path."""
+    chart_id, draft = job
+    builder, filename = CHARTS[chart_id]
+    if draft:
+        builder = DRAFT_BUILDERS[chart_id]
+    path = output_dir / filename
+    builder(path)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--draft",
+        action="store_true",
+        help="Rasterize simplified bar charts with NumPy/Pillow instead of matplotlib",
+    )
+    args = parser.parse_args()
+
+    # Create the output directory once in the parent, before workers start
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Charts are independent, so render and PNG-encode them on separate cores
+    with multiprocessing.Pool(processes=len(CHARTS)) as pool:
+        paths = pool.map(_dispatch, [(chart_id, args.draft) for chart_id in CHARTS])
+
+    for path in paths:
+        print(f"✓ Saved: {path}")
+
+    print()
+    print("=" * 60)
+    print("✅ ALL CHARTS GENERATED SUCCESSFULLY")
+    print("=" * 60)
+    print(f"Output directory: {output_dir}")
+    print()
+    print("Charts created:")
+    print("  1. killer_chart.png - 4-panel progression chart")
+    print("  2. comparison_bars.png - Grouped bar comparison")
+    print("  3. progression_line.png - Line chart showing improvement")
+    print("  4. verification_comparison.png - Baseline vs final")
+    print()
+
 
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ setup(
         "fastapi>=0.100.0",
         "uvicorn>=0.23.0",
         "pydantic>=2.0.0",
+        "orjson>=3.9.0",
         "colorlog>=6.7.0",
     ],
     extras_require={
@@ -28,6 +29,14 @@ setup(
             "mypy>=1.0.0",
             "black>=23.0.0",
         ],
+        "demo": [
+            "matplotlib>=3.6.0",
+            "Pillow>=10.1.0",
+            "pyspng-seunglab>=1.1.0",
+        ],
+        "fast": [
+            "numba>=0.57.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -5,30 +5,53 @@ Google Tunix Hackathon Submission
 
 __version__ = "1.0.0"
 
-from src.data_loader import (
-    OptimizationDataset,
-    KnapsackItem,
-    DatasetEntry,
-    VerificationResult,
-)
-from src.format_utils import format_input, parse_output, PROMPT_TEMPLATE
-from src.verifiers import Verifier, DetailedVerificationResult
-from src.rewards import (
-    format_reward_func,
-    feasibility_reward_func,
-    optimality_reward_func,
-    brevity_reward_func,
-)
-from src.inference_engine import InferenceEngine, MockInference
-from src.config import Config
-from src.logger import get_logger, setup_logger
-from src.validation import (
-    ProblemValidator,
-    OutputValidator,
-    ValidationResult as ValidResult,
-)
-from src.export_utils import ModelExporter
-from src.benchmark import BenchmarkSuite, BenchmarkMetrics
+import importlib
+
+# Public name -> (module, attribute). Submodules are imported on first access
+# (PEP 562) so lightweight callers don't pay for JAX/solver imports up front.
+_LAZY = {
+    "OptimizationDataset": ("src.data_loader", "OptimizationDataset"),
+    "KnapsackItem": ("src.data_loader", "KnapsackItem"),
+    "DatasetEntry": ("src.data_loader", "DatasetEntry"),
+    "VerificationResult": ("src.data_loader", "VerificationResult"),
+    "format_input": ("src.format_utils", "format_input"),
+    "parse_output": ("src.format_utils", "parse_output"),
+    "PROMPT_TEMPLATE": ("src.format_utils", "PROMPT_TEMPLATE"),
+    "Verifier": ("src.verifiers", "Verifier"),
+    "DetailedVerificationResult": ("src.verifiers", "DetailedVerificationResult"),
+    "format_reward_func": ("src.rewards", "format_reward_func"),
+    "feasibility_reward_func": ("src.rewards", "feasibility_reward_func"),
+    "optimality_reward_func": ("src.rewards", "optimality_reward_func"),
+    "brevity_reward_func": ("src.rewards", "brevity_reward_func"),
+    "score_all": ("src.rewards", "score_all"),
+    "preparse_completions": ("src.rewards", "preparse_completions"),
+    "InferenceEngine": ("src.inference_engine", "InferenceEngine"),
+    "MockInference": ("src.inference_engine", "MockInference"),
+    "Config": ("src.config", "Config"),
+    "get_logger": ("src.logger", "get_logger"),
+    "setup_logger": ("src.logger", "setup_logger"),
+    "ProblemValidator": ("src.validation", "ProblemValidator"),
+    "OutputValidator": ("src.validation", "OutputValidator"),
+    "ValidResult": ("src.validation", "ValidationResult"),
+    "ModelExporter": ("src.export_utils", "ModelExporter"),
+    "BenchmarkSuite": ("src.benchmark", "BenchmarkSuite"),
+    "BenchmarkMetrics": ("src.benchmark", "BenchmarkMetrics"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+
 
 __all__ = [
     "OptimizationDataset",
@@ -44,6 +67,8 @@ __all__ = [
     "feasibility_reward_func",
     "optimality_reward_func",
     "brevity_reward_func",
+    "score_all",
+    "preparse_completions",
     "InferenceEngine",
     "MockInference",
     "Config",
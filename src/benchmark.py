@@ -8,15 +8,65 @@ average output tokens."
 
 import json
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from src.data_loader import OptimizationDataset
-from src.format_utils import parse_output
+from src.format_utils import parse_output, REQUIRED_TAGS
 from src.verifiers import Verifier, DetailedVerificationResult
 from src.logger import get_logger
 
 logger = get_logger(__name__)
 
+_REQUIRED_TAGS = frozenset(REQUIRED_TAGS)
+
+
+def _claimed_status(certificate: str) -> Optional[str]:
+    """Status claimed by an optimality certificate (OPTIMAL wins over BOUNDED)."""
+    if 'Status: OPTIMAL' in certificate:
+        return 'OPTIMAL'
+    if 'Status: BOUNDED' in certificate:
+        return 'BOUNDED'
+    return None
+
+
+# Per-process verifier for pool workers (set by _init_worker)
+_worker_verifier: Optional[Verifier] = None
+
+
+def _init_worker() -> None:
+    """ProcessPoolExecutor initializer: build one Verifier per worker process."""
+    global _worker_verifier
+    _worker_verifier = Verifier()
+
+
+def _verify_case(
+    args: Tuple[int, str, str, Optional[str]], verifier: Optional[Verifier] = None
+) -> Optional[Tuple[bool, bool, bool, int]]:
+    """
+    Verify a single benchmark case.
+
+    Top-level so it can be dispatched to worker processes.
+
+    Args:
+        args: (case index, problem text, answer JSON, claimed status)
+        verifier: Verifier to use (defaults to the worker's verifier)
+
+    Returns:
+        (is_feasible, is_optimal, false_optimal_claim, gap), or None on error
+    """
+    i, problem_text, answer, claimed_status = args
+    verifier = verifier or _worker_verifier
+    try:
+        result = verifier.verify_comprehensive(
+            problem_text, answer, claimed_status=claimed_status
+        )
+    except Exception as e:
+        logger.debug(f"Verification error on case {i}: {e}")
+        return None
+    return result.is_feasible, result.is_optimal, result.false_optimal_claim, result.gap
+
 
 @dataclass
 class BenchmarkMetrics:
@@ -56,13 +106,15 @@ class BenchmarkSuite:
     - Average output tokens
     """
     
-    def __init__(self, size: int = 100, seed: int = 123):
+    def __init__(self, size: int = 100, seed: int = 123, cache_dir: Optional[str] = None):
         """
         Initialize benchmark suite.
         
         Args:
             size: Number of test cases (50-200 recommended)
             seed: Random seed for reproducibility
+            cache_dir: Directory for the test case cache (defaults to
+                DataConfig.cache_dir; None disables it)
         """
         if size < 50 or size > 200:
             logger.warning(f"Benchmark size {size} outside recommended range [50, 200]")
@@ -78,12 +130,14 @@ class BenchmarkSuite:
             include_variants=True,  # Include problem variants
             min_num_items=3,
             max_num_items=8,
+            cache_dir=cache_dir,
         )
     
     def run_benchmark(
         self, 
         inference_fn: Optional[callable] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        num_workers: int = 1,
     ) -> BenchmarkMetrics:
         """
         Run benchmark suite and compute metrics.
@@ -92,85 +146,101 @@ class BenchmarkSuite:
             inference_fn: Function that takes problem_text and returns output_text
                          If None, uses ground truth targets for validation
             verbose: Print detailed progress
+            num_workers: Processes used for verification (default 1 verifies
+                         in-process; the pool only pays off for large suites)
         
         Returns:
             BenchmarkMetrics with all computed metrics
         """
         logger.info(f"Running benchmark on {self.size} cases...")
-        
-        format_valid_count = 0
+
+        # Phase 1: materialize all outputs (either from inference or ground truth).
+        # The branch is taken once, so the quiet ground-truth path is a plain
+        # comprehension.
+        total_inference_time_ns = 0
+        if inference_fn is None and not verbose:
+            outputs: List[str] = [case['target'] for case in self.test_cases]
+        elif inference_fn is None:
+            outputs = []
+            for i, case in enumerate(self.test_cases):
+                if (i + 1) % 20 == 0:
+                    logger.info(f"  Progress: {i + 1}/{self.size}")
+                outputs.append(case['target'])
+        else:
+            outputs = []
+            for i, case in enumerate(self.test_cases):
+                if verbose and (i + 1) % 20 == 0:
+                    logger.info(f"  Progress: {i + 1}/{self.size}")
+
+                t0 = time.perf_counter_ns()
+                outputs.append(inference_fn(case['problem']))
+                total_inference_time_ns += time.perf_counter_ns() - t0
+
+        # Phase 2: parse all outputs up front, outside the verification loop
+        parsed_outputs = [parse_output(output_text) for output_text in outputs]
+
+        # Phase 3: batched string metrics over the whole suite
+        format_valid = np.fromiter(
+            (_REQUIRED_TAGS.issubset({k for k, v in parsed.items() if v is not None})
+             for parsed in parsed_outputs),
+            dtype=bool,
+            count=len(parsed_outputs),
+        )
+        format_valid_count = int(format_valid.sum())
+
+        # Count tokens (approximate: split by whitespace)
+        total_tokens = sum(len(output_text.split()) for output_text in outputs)
+
+        # Extract claimed status from optimality certificates in one pass
+        claimed_statuses = [
+            _claimed_status(parsed.get('optimality_certificate') or '')
+            for parsed in parsed_outputs
+        ]
+
+        # Phase 4: verification. Cases are independent, so they fan out across
+        # worker processes; only cases with an answer are verified.
+        verify_args = [
+            (i, case['problem'], parsed['answer'], claimed_statuses[i])
+            for i, (case, parsed) in enumerate(zip(self.test_cases, parsed_outputs))
+            if parsed.get('answer')
+        ]
+        if num_workers > 1 and len(verify_args) > 1:
+            with ProcessPoolExecutor(
+                max_workers=num_workers, initializer=_init_worker
+            ) as ex:
+                results = list(ex.map(_verify_case, verify_args, chunksize=8))
+        else:
+            results = [_verify_case(args, self.verifier) for args in verify_args]
+
         feasible_count = 0
         optimal_count = 0
         false_optimal_claims = 0
-        total_tokens = 0
-        total_inference_time = 0.0
-        gaps = []
-        
-        for i, case in enumerate(self.test_cases):
-            if verbose and (i + 1) % 20 == 0:
-                logger.info(f"  Progress: {i + 1}/{self.size}")
-            
-            # Get output (either from inference or ground truth)
-            start_time = time.time()
-            if inference_fn:
-                output_text = inference_fn(case['problem'])
-            else:
-                output_text = case['target']
-            inference_time = time.time() - start_time
-            total_inference_time += inference_time
-            
-            # Parse output
-            parsed = parse_output(output_text)
-            
-            # Check format validity (all required tags present)
-            required_tags = ['parse', 'reasoning', 'solution', 'feasibility_certificate',
-                           'optimality_certificate', 'final', 'answer']
-            format_valid = all(parsed.get(tag) is not None for tag in required_tags)
-            if format_valid:
-                format_valid_count += 1
-            
-            # Count tokens (approximate: split by whitespace)
-            total_tokens += len(output_text.split())
-            
-            # Verify solution if answer is present
-            if parsed.get('answer'):
-                try:
-                    # Extract claimed status from optimality certificate
-                    claimed_status = None
-                    if parsed.get('optimality_certificate'):
-                        if 'Status: OPTIMAL' in parsed['optimality_certificate']:
-                            claimed_status = 'OPTIMAL'
-                        elif 'Status: BOUNDED' in parsed['optimality_certificate']:
-                            claimed_status = 'BOUNDED'
-                    
-                    # Comprehensive verification
-                    result = self.verifier.verify_comprehensive(
-                        case['problem'],
-                        parsed['answer'],
-                        claimed_status=claimed_status
-                    )
-                    
-                    if result.is_feasible:
-                        feasible_count += 1
-                    if result.is_optimal:
-                        optimal_count += 1
-                    if result.false_optimal_claim:
-                        false_optimal_claims += 1
-                    
-                    gaps.append(result.gap)
-                    
-                except Exception as e:
-                    logger.debug(f"Verification error on case {i}: {e}")
-        
+        gaps = np.empty(self.size, dtype=np.float64)
+        gaps_n = 0
+
+        for result in results:
+            if result is None:
+                continue
+            is_feasible, is_optimal, false_optimal_claim, gap = result
+            if is_feasible:
+                feasible_count += 1
+            if is_optimal:
+                optimal_count += 1
+            if false_optimal_claim:
+                false_optimal_claims += 1
+
+            gaps[gaps_n] = gap
+            gaps_n += 1
+
         # Compute metrics
         metrics = BenchmarkMetrics(
             format_accuracy=100.0 * format_valid_count / self.size,
             parse_success_rate=100.0 * format_valid_count / self.size,
             feasibility_rate=100.0 * feasible_count / self.size,
             optimality_rate=100.0 * optimal_count / self.size,
-            average_gap=sum(gaps) / len(gaps) if gaps else 0.0,
+            average_gap=float(gaps[:gaps_n].mean()) if gaps_n else 0.0,
             average_output_tokens=total_tokens / self.size,
-            average_inference_time=total_inference_time / self.size,
+            average_inference_time=total_inference_time_ns / 1e9 / self.size,
             false_optimal_claims=false_optimal_claims,
             total_cases=self.size,
             format_valid_count=format_valid_count,
@@ -23,6 +23,8 @@ class DataConfig:
     min_item_value: int = 10
     max_item_value: int = 100
     random_seed: int = 42
+    # Directory for the generated-dataset cache (None disables it)
+    cache_dir: Optional[str] = None
 
 
 @dataclass
@@ -87,6 +89,9 @@ class RLConfig:
     # Higher weights for more critical objectives
     reward_weights: List[float] = field(default_factory=lambda: [1.0, 2.0, 3.0, 0.5])
 
+    # Processes that verify reward answers (1 = in-process, memoized)
+    reward_num_workers: int = 1
+
 
 @dataclass
 class InferenceConfig:
@@ -159,6 +164,9 @@ class Config:
             config.inference.model_path = os.getenv("MODEL_PATH")
             config.deployment.model_path = os.getenv("MODEL_PATH")
 
+        if os.getenv("COR_DATASET_CACHE"):
+            config.data.cache_dir = os.getenv("COR_DATASET_CACHE")
+
         if os.getenv("LOG_LEVEL"):
             config.logging.log_level = os.getenv("LOG_LEVEL")
             config.deployment.log_level = os.getenv("LOG_LEVEL").lower()
@@ -3,18 +3,497 @@ Data loader for constraint optimization problems.
 Generates synthetic Knapsack problems with ground truth solutions and reasoning traces.
 """
 
-import json
-import random
-from typing import List, Dict, Tuple, TypedDict, Any, Optional
-from dataclasses import dataclass, asdict
+import functools
+import hashlib
+import os
+import sys
+import weakref
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, TypedDict, Union
+from dataclasses import dataclass
+import numpy as np
 from src.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Numba is optional: it compiles the knapsack DP to native code, otherwise the
+# vectorized NumPy fill below is used
+try:
+    from numba import njit
 
-@dataclass
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+# Bump whenever generated problems/targets change so stale cache files are
+# never picked up under the same configuration key
+_CACHE_VERSION = 4
+
+# Problems generated per shard (one RNG stream and one batched solve each)
+_SHARD_SIZE = 4096
+
+# Entries of lazy datasets kept formatted (see OptimizationDataset._materialize)
+_MATERIALIZE_CACHE_SIZE = 2048
+
+# One item of the prompt's JSON array after its name, laid out exactly as
+# json.dumps would (generated names are plain ASCII, so no escaping is needed)
+_ITEM_JSON_TMPL = '{}{}, "value": {}}}'
+
+
+def _dumps_names(names: List[str]) -> str:
+    """
+    ``json.dumps`` of a list of generated item names, without the encoder.
+
+    Names are plain ASCII identifiers, so quoting and joining reproduces the
+    stdlib output byte for byte. (orjson is fast too, but its compact
+    separators would change the training targets.)
+    """
+    return '["' + '", "'.join(names) + '"]' if names else "[]"
+
+
+@functools.lru_cache(maxsize=None)
+def _item_name_styles(count: int) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Item names for each naming style, built once and shared by every problem.
+
+    Args:
+        count: Number of names per style (the maximum items per problem)
+
+    Returns:
+        One tuple of ``count`` names per style, e.g. ``Item_0``, ``A``, ``item0``, ``obj_0``
+    """
+    return (
+        tuple(f"Item_{j}" for j in range(count)),
+        tuple(chr(65 + j) for j in range(count)),  # A, B, C, ...
+        tuple(f"item{j}" for j in range(count)),
+        tuple(f"obj_{j}" for j in range(count)),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _item_json_heads(count: int) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Per-style JSON prefixes (``{"name": "Item_0", "weight": ``) for each item name.
+
+    Args:
+        count: Number of names per style (the maximum items per problem)
+
+    Returns:
+        Tuples parallel to :func:`_item_name_styles`
+    """
+    return tuple(
+        tuple(f'{{"name": "{name}", "weight": ' for name in names)
+        for names in _item_name_styles(count)
+    )
+
+
+# Constant fragments of the problem prompt
+_P_CAPACITY = "Knapsack capacity: "
+_P_ITEMS = ". Available items: "
+_P_TASK = ". Select items to maximize value without exceeding capacity."
+_P_MIN_QUALITY = " Additional constraint: Total value must be at least "
+
+# Backtrack line ending for items left out of the optimal set
+_TRACE_SKIPPED = "Skipped (Not part of optimal set)."
+
+# Constant fragments of the target output, joined around the per-problem
+# values in OptimizationDataset._format_target
+_T_PARSE = '<parse>\n{"capacity": '
+_T_ITEMS = ', "items": '
+_T_REASONING = "}\n</parse>\n\n<reasoning>\n"
+_T_SOLUTION = '\n</reasoning>\n\n<solution>\n{"selected": '
+_T_TOTAL_WEIGHT = ', "total_weight": '
+_T_TOTAL_VALUE = ', "total_value": '
+_T_FEASIBILITY = "}\n</solution>\n\n<feasibility_certificate>\n"
+_T_WEIGHT_CHECK = "\nWeight check: "
+_T_LE = " <= "
+_T_OPTIMALITY = (
+    " (capacity)\nItem validity: All selected items exist in problem\n"
+    "</feasibility_certificate>\n\n<optimality_certificate>\n"
+)
+_T_OPTIMUM = "\nComputed optimum: "
+_T_FINAL = (
+    "\nStatus: OPTIMAL\nGap: 0\n</optimality_certificate>\n\n<final>\n"
+    "Solution quality: OPTIMAL\nVerification status: PASSED\n"
+    "Confidence: HIGH (deterministic DP solver)\nSelected "
+)
+_T_FINAL_VALUE = " items with total value "
+_T_FINAL_WEIGHT = " and weight "
+_T_SLASH = "/"
+_T_ANSWER = "\n</final>\n\n<answer>\n"
+_T_END = "\n</answer>"
+
+# Numeric OptimizationDataset attributes that can live in shared memory
+_SHARED_ARRAYS = ("capacities", "num_items_per_problem", "weights", "values")
+
+
+def _value_dtype(values: np.ndarray) -> np.dtype:
+    """
+    Narrowest signed dtype that holds any subset sum of ``values`` (and -1).
+
+    DP tables are int16 (2 bytes/cell) for the generator's ranges and only
+    widen to int32 when the item values could overflow it.
+
+    Args:
+        values: Non-negative item values (any shape; rows summed if 2-D)
+
+    Returns:
+        ``np.int16`` or ``np.int32``
+    """
+    largest = int(values.sum(axis=-1).max()) if values.size else 0
+    return np.dtype(np.int16) if largest <= np.iinfo(np.int16).max else np.dtype(np.int32)
+
+
+def _knapsack_fill_numpy(
+    weights: np.ndarray, values: np.ndarray, capacity: int
+) -> Tuple[np.ndarray, int]:
+    """
+    0/1 knapsack DP over a rolling int32 row, one vectorized update per item.
+
+    Args:
+        weights: Positive item weights, int32 of shape (n,)
+        values: Item values, int32 of shape (n,)
+        capacity: Knapsack capacity
+
+    Returns:
+        Tuple of (keep, max_value) where ``keep[i, w]`` is True when item i
+        strictly improved the best value at capacity w
+    """
+    n = weights.shape[0]
+    dtype = _value_dtype(values)
+    values = values.astype(dtype, copy=False)
+    dp = np.zeros(capacity + 1, dtype=dtype)
+    keep = np.zeros((n, capacity + 1), dtype=np.bool_)
+    for i in range(n):
+        wt = int(weights[i])
+        if wt > capacity:
+            continue
+        # candidate is a fresh array, so every cell still reads the
+        # previous item's row (0/1, not unbounded knapsack)
+        candidate = dp[:-wt] + values[i]
+        improved = keep[i, wt:]
+        np.greater(candidate, dp[wt:], out=improved)
+        # Reuse the comparison instead of a second pass through np.maximum
+        np.copyto(dp[wt:], candidate, where=improved)
+    return keep, int(dp[capacity])
+
+
+def _knapsack_fill_loops(
+    weights: np.ndarray, values: np.ndarray, capacity: int
+) -> Tuple[np.ndarray, int]:
+    """Scalar-loop form of :func:`_knapsack_fill_numpy`, compiled by numba."""
+    n = weights.shape[0]
+    dp = np.zeros(capacity + 1, dtype=np.int32)
+    keep = np.zeros((n, capacity + 1), dtype=np.bool_)
+    for i in range(n):
+        wt = weights[i]
+        val = values[i]
+        # Right-to-left so dp[w - wt] still holds the previous item's row
+        for w in range(capacity, wt - 1, -1):
+            candidate = dp[w - wt] + val
+            if candidate > dp[w]:
+                dp[w] = candidate
+                keep[i, w] = True
+    return keep, dp[capacity]
+
+
+if NUMBA_AVAILABLE:
+    _knapsack_fill = njit(cache=True, nogil=True, boundscheck=False)(_knapsack_fill_loops)
+else:
+    _knapsack_fill = _knapsack_fill_numpy
+
+
+def _knapsack_fill_batch(
+    weights: np.ndarray, values: np.ndarray, max_capacity: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fill the 0/1 knapsack DP for a whole batch of problems at once.
+
+    Rows are problems and items are zero-padded to a common width (a padded
+    item of weight 0 and value 0 never improves a cell). The loop runs over
+    item positions only, so its length is the padded width, not the batch size.
+
+    Args:
+        weights: Item weights, int32 of shape (N, K), zero-padded
+        values: Item values, int32 of shape (N, K), zero-padded
+        max_capacity: Largest capacity in the batch
+
+    Returns:
+        Tuple of (keep, dp). ``keep`` is bit-packed along capacity with
+        ``np.packbits`` (shape (N, K, ceil((C+1)/8)), 1 bit per cell); unpack a
+        problem's rows with :func:`_unpack_keep` to get ``keep[i, w]`` as in
+        :func:`_knapsack_fill_numpy`. ``dp[p, w]`` is the best value for
+        problem p at capacity w.
+    """
+    size, width = weights.shape
+    dtype = _value_dtype(values)
+    values = values.astype(dtype, copy=False)
+    cells = np.arange(max_capacity + 1, dtype=np.int32)
+    dp = np.zeros((size, max_capacity + 1), dtype=dtype)
+    keep = np.zeros((size, width, (max_capacity + 8) // 8), dtype=np.uint8)
+    for i in range(width):
+        wt = weights[:, i : i + 1]
+        src = cells - wt  # (N, C+1): cell each capacity would extend from
+        fits = src >= 0
+        candidate = np.take_along_axis(dp, np.maximum(src, 0), axis=1) + values[:, i : i + 1]
+        improved = fits & (candidate > dp)
+        keep[:, i] = np.packbits(improved, axis=1)
+        np.copyto(dp, candidate, where=improved)
+    return keep, dp
+
+
+def _unpack_keep(packed: np.ndarray, capacity: int) -> np.ndarray:
+    """
+    Unpack one problem's bit-packed keep rows from :func:`_knapsack_fill_batch`.
+
+    Args:
+        packed: Packed rows of shape (K, ceil((C+1)/8))
+        capacity: Capacity of the problem; cells past it are dropped
+
+    Returns:
+        Boolean array of shape (K, capacity + 1)
+    """
+    return np.unpackbits(packed, axis=1, count=capacity + 1).view(np.bool_)
+
+
+def _backtrack_mask(keep: np.ndarray, weights: np.ndarray, capacity: int) -> int:
+    """
+    Walk a DP keep table from the last item down into a selection bitmask.
+
+    Args:
+        keep: ``keep[i, w]`` from a DP fill
+        weights: Item weights
+        capacity: Knapsack capacity
+
+    Returns:
+        Bitmask with bit i set when item i is selected
+    """
+    mask = 0
+    w = capacity
+    for i in range(len(weights) - 1, -1, -1):
+        if keep[i, w]:
+            mask |= 1 << i
+            w -= int(weights[i])
+    return mask
+
+
+# Problems with at most this many items are solved by enumerating all 2^n
+# subsets instead of filling a DP table
+_ENUM_MAX_ITEMS = 8
+_ENUM_CHUNK = 4096  # problems per (chunk, 2^K) intermediate
+
+# Upper bound on separate batched DP fills in _solve_many (one per capacity)
+_DP_MAX_GROUPS = 64
+
+
+def _best_subsets(
+    weights: np.ndarray, values: np.ndarray, capacities: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exhaustively pick the best feasible subset for a batch of small problems.
+
+    Among optimal subsets the numerically smallest bitmask wins (``argmax``
+    returns the first maximum), which is exactly the subset the DP backtrack
+    selects: it drops the highest-index item whenever that keeps the optimum.
+
+    Args:
+        weights: Item weights, int32 of shape (N, K) with K <= _ENUM_MAX_ITEMS,
+            zero-padded (padded bits only appear in larger, never-chosen masks)
+        values: Item values, int32 of shape (N, K), zero-padded
+        capacities: Capacities of shape (N,)
+
+    Returns:
+        Tuple of (masks, best_values), each of shape (N,)
+    """
+    size, width = weights.shape
+    # bits[m, i] = 1 when subset m contains item i
+    bits = (np.arange(1 << width)[:, None] >> np.arange(width)) & 1
+    dtype = _value_dtype(values)
+    bits = bits.astype(dtype).T  # (K, 2^K)
+    values = values.astype(dtype, copy=False)
+    masks = np.empty(size, dtype=np.int64)
+    best = np.empty(size, dtype=np.int32)
+    for start in range(0, size, _ENUM_CHUNK):
+        stop = start + _ENUM_CHUNK
+        subset_weight = weights[start:stop] @ bits
+        subset_value = values[start:stop] @ bits
+        subset_value[subset_weight > capacities[start:stop, None]] = -1
+        masks[start:stop] = subset_value.argmax(axis=1)
+        best[start:stop] = subset_value[np.arange(len(subset_value)), masks[start:stop]]
+    return masks, best
+
+
+def _make_enumerator(n: int) -> Callable[..., Tuple[int, int]]:
+    """
+    Build a straight-line subset enumerator specialized for ``n`` items.
+
+    The generated function takes ``(capacity, w0, v0, w1, v1, ...)`` and checks
+    every non-empty subset in increasing bitmask order with its weight and
+    value sums written out as plain additions (no loops, no indexing). The
+    strict ``>`` keeps the smallest optimal mask, matching :func:`_best_subsets`.
+
+    Args:
+        n: Number of items
+
+    Returns:
+        Function returning (selection bitmask, optimal value)
+    """
+    params = ", ".join(f"w{i}, v{i}" for i in range(n))
+    lines = [f"def _enumerate_{n}(capacity, {params}):", "    best = 0", "    best_mask = 0"]
+    for mask in range(1, 1 << n):
+        members = [i for i in range(n) if mask >> i & 1]
+        weight = " + ".join(f"w{i}" for i in members)
+        value = " + ".join(f"v{i}" for i in members)
+        lines += [
+            f"    if {weight} <= capacity and {value} > best:",
+            f"        best = {value}",
+            f"        best_mask = {mask}",
+        ]
+    lines.append("    return best_mask, best")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace[f"_enumerate_{n}"]
+
+
+# Specialized enumerators for the smallest (and most common) problem sizes;
+# larger problems use the generic NumPy enumeration or the DP
+_ENUMERATORS = {n: _make_enumerator(n) for n in range(1, 4)}
+
+
+@functools.lru_cache(maxsize=65536)
+def _solve_selection(
+    capacity: int, weights: Tuple[int, ...], values: Tuple[int, ...]
+) -> Tuple[int, int]:
+    """
+    Optimal selection for one problem, memoized on its numbers (names play no part).
+
+    Args:
+        capacity: Knapsack capacity
+        weights: Positive item weights
+        values: Item values
+
+    Returns:
+        Tuple of (selection bitmask, optimal value)
+
+    Raises:
+        ValueError: If the DP table cannot be allocated
+    """
+    n = len(weights)
+    if sum(weights) <= capacity and all(value > 0 for value in values):
+        # Everything fits and every item adds value: take everything
+        return (1 << n) - 1, sum(values)
+    if min(weights, default=0) > capacity:
+        return 0, 0
+
+    enumerator = _ENUMERATORS.get(n)
+    if enumerator is not None:
+        return enumerator(capacity, *(x for pair in zip(weights, values) for x in pair))
+
+    weights_arr = np.fromiter(weights, dtype=np.int32, count=n)
+    values_arr = np.fromiter(values, dtype=np.int32, count=n)
+    if n <= _ENUM_MAX_ITEMS:
+        masks, best_values = _best_subsets(
+            weights_arr[None, :], values_arr[None, :], np.array([capacity])
+        )
+        return int(masks[0]), int(best_values[0])
+
+    # keep[i, w] records whether item i improved the best value at
+    # capacity w, which is all the backtrack needs from the 2-D table
+    try:
+        keep, max_val = _knapsack_fill(weights_arr, values_arr, capacity)
+    except MemoryError as e:
+        raise ValueError(f"DP table too large (n={n}, capacity={capacity}): {e}")
+    return _backtrack_mask(keep, weights_arr, capacity), int(max_val)
+
+
+def _solve_many(
+    capacities: np.ndarray, num_items: np.ndarray, weights: np.ndarray, values: np.ndarray
+) -> Tuple[List[int], List[int]]:
+    """
+    Optimal selections for a batch of problems in one pass.
+
+    Args:
+        capacities: Capacities, shape (N,)
+        num_items: Items per problem, shape (N,)
+        weights: Weights, zero-padded past each problem's items, shape (N, K)
+        values: Values, zero-padded likewise, shape (N, K)
+
+    Returns:
+        Tuple of (selection bitmasks, optimal values), one per problem
+
+    Raises:
+        ValueError: If the DP table cannot be allocated
+    """
+    count, width = weights.shape
+    if width <= _ENUM_MAX_ITEMS:
+        # Identical problems (same capacity and item numbers, in order)
+        # are common in these small ranges; solve each distinct one once
+        keys = np.column_stack((capacities, weights, values))
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        unique_masks, unique_best = _best_subsets(
+            unique_keys[:, 1 : width + 1],
+            unique_keys[:, width + 1 :],
+            unique_keys[:, 0],
+        )
+        inverse = inverse.reshape(-1)
+        return unique_masks[inverse].tolist(), unique_best[inverse].tolist()
+
+    if NUMBA_AVAILABLE:
+        # Compiled per-problem fills beat the batched NumPy fill and
+        # never materialize the (N, K, C+1) keep tensor
+        masks = []
+        best_values = []
+        for k, (capacity, n) in enumerate(zip(capacities.tolist(), num_items.tolist())):
+            keep, best = _knapsack_fill(weights[k, :n], values[k, :n], capacity)
+            masks.append(_backtrack_mask(keep, weights[k, :n], capacity))
+            best_values.append(int(best))
+        return masks, best_values
+
+    # Batch problems that share a capacity so each group's table stops at
+    # its own capacity (and item count) instead of the batch maximum; with
+    # many distinct capacities, fall back to contiguous capacity bands
+    order = np.argsort(capacities, kind="stable")
+    bounds = np.flatnonzero(np.diff(capacities[order])) + 1
+    if len(bounds) < _DP_MAX_GROUPS:
+        groups = np.split(order, bounds)
+    else:
+        groups = np.array_split(order, _DP_MAX_GROUPS)
+
+    masks: List[int] = [0] * count
+    best_values: List[int] = [0] * count
+    for group in groups:
+        group_capacities = capacities[group]
+        max_capacity = int(group_capacities.max())
+        group_width = int(num_items[group].max())
+        group_weights = weights[group, :group_width]
+        try:
+            keep, dp = _knapsack_fill_batch(
+                group_weights, values[group, :group_width], max_capacity
+            )
+        except MemoryError as e:
+            raise ValueError(
+                f"DP table too large (size={len(group)}, items={group_width}, "
+                f"capacity={max_capacity}): {e}"
+            )
+        best = dp[np.arange(len(group)), group_capacities].tolist()
+        for j, (k, capacity) in enumerate(zip(group.tolist(), group_capacities.tolist())):
+            masks[k] = _backtrack_mask(
+                _unpack_keep(keep[j], capacity), group_weights[j], capacity
+            )
+            best_values[k] = best[j]
+    return masks, best_values
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a __dict__
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class KnapsackItem:
-    """Represents an item in a knapsack problem."""
+    """Represents an item in a knapsack problem (immutable, hashable)."""
 
     name: str
     weight: int
@@ -37,6 +516,181 @@ class DatasetEntry(TypedDict):
     id: str  # Unique identifier
 
 
+class _RawEntry(NamedTuple):
+    """Solved problem kept until its target text is requested (see ``_format_target``)."""
+
+    problem: str
+    id: str
+    capacity: int
+    items_json: str
+    solution: List[str]
+    reasoning: str
+    validation: VerificationResult
+    total_weight: int
+    total_value: int
+    quality_status: Optional[str]  # Set for budget + min-quality variants
+
+
+class ProblemArrays(NamedTuple):
+    """Numeric view of one problem (row views into the dataset arrays, no copy)."""
+
+    capacity: np.int32
+    weights: np.ndarray  # shape (num_items,)
+    values: np.ndarray  # shape (num_items,)
+
+
+class _ShardParams(NamedTuple):
+    """Generation settings a shard needs (see ``_generate_shard``)."""
+
+    min_capacity: int
+    max_capacity: int
+    min_num_items: int
+    max_num_items: int
+    min_item_weight: int
+    max_item_weight: int
+    min_item_value: int
+    max_item_value: int
+    include_variants: bool
+    lazy: bool
+
+
+def _generate_shard(
+    params: _ShardParams,
+    start: int,
+    stop: int,
+    seed: Union[int, np.random.SeedSequence],
+) -> Tuple[List[_RawEntry], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Generate and solve problems ``start`` to ``stop - 1`` from their own RNG.
+
+    Module-level (not a bound method) so process pools pickle only ``params``
+    rather than the whole dataset.
+
+    Args:
+        params: Generation settings of the dataset
+        start: Index of the first problem (used for ids and mix ratios)
+        stop: One past the index of the last problem
+        seed: Seed (or ``SeedSequence``) for this shard's ``np.random.Generator``
+
+    Returns:
+        Tuple of (entries, capacities (n,), weights (n, K), values (n, K),
+        styles (n,), min_qualities (n,)) with items zero-padded to the
+        shard's widest problem. Lazy datasets skip solving and return no
+        entries.
+    """
+    rng = np.random.default_rng(seed)
+    start, stop = int(start), int(stop)
+    count = stop - start
+    index = np.arange(start, stop)
+
+    # Draw every random quantity for the shard in bulk
+    # Generate valid capacity (avoid zero or negative)
+    capacities_arr = rng.integers(
+        params.min_capacity, params.max_capacity, count, endpoint=True, dtype=np.int32
+    )
+    capacities_arr[capacities_arr <= 0] = params.min_capacity
+
+    # Per judge: expand to 4-8 items with controlled growth
+    # 70% use base range (3-5), 30% use extended range (4-8)
+    base_counts = rng.integers(
+        params.min_num_items, min(5, params.max_num_items), count, endpoint=True
+    )
+    extended_counts = rng.integers(
+        max(4, params.min_num_items), params.max_num_items, count, endpoint=True
+    )
+    num_items = np.where(index % 10 < 7, base_counts, extended_counts)
+    width = int(num_items.max())
+
+    # Randomize item naming for generalization
+    name_styles = _item_name_styles(params.max_num_items)
+    json_heads = _item_json_heads(params.max_num_items)
+    style_ids = rng.integers(0, len(name_styles), count)
+
+    # Ensure positive weights and values; zero the padding past each problem
+    present = np.arange(width) < num_items[:, None]
+    weights = rng.integers(
+        params.min_item_weight,
+        params.max_item_weight,
+        (count, width),
+        endpoint=True,
+        dtype=np.int32,
+    )
+    values = rng.integers(
+        params.min_item_value,
+        params.max_item_value,
+        (count, width),
+        endpoint=True,
+        dtype=np.int32,
+    )
+    weights = np.where(present, np.maximum(weights, 1), 0).astype(np.int32)
+    values = np.where(present, np.maximum(values, 1), 0).astype(np.int32)
+
+    # Per judge: add second micro-domain variant (10% of problems)
+    # Variant: "budget + min-quality" constraint
+    quality_draws = rng.integers(5, 15, count, endpoint=True)
+    is_variant = (index % 10 == 0) if params.include_variants else np.zeros(count, bool)
+
+    # Validate before solving (lazy datasets solve on access)
+    max_capacity = int(capacities_arr.max())
+    if max_capacity > 100000:
+        raise ValueError(
+            f"Capacity too large ({max_capacity}), may cause memory overflow"
+        )
+    if params.lazy:
+        return (
+            [],
+            capacities_arr,
+            weights,
+            values,
+            style_ids.astype(np.int8),
+            np.where(is_variant, quality_draws, 0).astype(np.int16),
+        )
+
+    capacities: List[int] = capacities_arr.tolist()
+    item_weights: List[List[int]] = [
+        row[:n] for row, n in zip(weights.tolist(), num_items.tolist())
+    ]
+    item_values: List[List[int]] = [
+        row[:n] for row, n in zip(values.tolist(), num_items.tolist())
+    ]
+    styles: List[int] = style_ids.tolist()
+    min_qualities: List[Optional[int]] = [
+        quality if variant else None
+        for quality, variant in zip(quality_draws.tolist(), is_variant.tolist())
+    ]
+    data: List[_RawEntry] = []
+
+    # Values are at least 1, so when everything fits, taking everything
+    # is the unique optimum; only the rest need solving
+    masks: List[int] = [(1 << n) - 1 for n in num_items.tolist()]
+    best_values: List[int] = values.sum(axis=1).tolist()
+    todo = np.flatnonzero(weights.sum(axis=1) > capacities_arr)
+    if len(todo):
+        todo_masks, todo_best = _solve_many(
+            capacities_arr[todo], num_items[todo], weights[todo], values[todo]
+        )
+        for k, mask, best in zip(todo.tolist(), todo_masks, todo_best):
+            masks[k] = mask
+            best_values[k] = best
+
+    for k, (capacity, min_quality) in enumerate(zip(capacities, min_qualities)):
+        data.append(
+            OptimizationDataset._build_entry(
+                start + k,
+                capacity,
+                name_styles[styles[k]],
+                json_heads[styles[k]],
+                item_weights[k],
+                item_values[k],
+                min_quality,
+                masks[k],
+                best_values[k],
+            )
+        )
+
+    return data, capacities_arr, weights, values, style_ids, quality_draws
+
+
 class OptimizationDataset:
     """
     Dataset loader for constraint optimization problems.
@@ -57,6 +711,10 @@ class OptimizationDataset:
         include_variants: bool = True,  # Per judge: add second micro-domain
         min_num_items: int = 3,  # Per judge: expand to 4-8 items
         max_num_items: int = 8,
+        cache_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        num_workers: int = 1,
+        lazy: bool = False,
     ):
         """
         Initialize the dataset with enhanced diversification per judge recommendations.
@@ -74,6 +732,21 @@ class OptimizationDataset:
             include_variants: Include problem variants (budget+quality, exclusions)
             min_num_items: Minimum number of items (default: 3)
             max_num_items: Maximum number of items (default: 8, per judge recommendations)
+            cache_path: Optional ``.npy`` file for the generated entries. Written on
+                first use; later constructions memory-map it instead of regenerating.
+                The path must be unique per generation configuration.
+            cache_dir: Optional directory for the same cache, with the file name
+                derived from a hash of every generation parameter (e.g.
+                ``~/.cache/cor_dataset``). Ignored if ``cache_path`` is given.
+                Defaults to DataConfig.cache_dir (set from ``COR_DATASET_CACHE``
+                by ``Config.from_env``), so training restarts can reuse datasets
+                without code changes.
+            num_workers: Processes used for generation. The dataset is the same
+                for any value, since shards are fixed-size and seeded from
+                ``seed`` independently of how they are scheduled.
+            lazy: Keep only the compact per-problem arrays and solve/format each
+                entry on access (recently used entries are LRU-cached). Same
+                entries as eager generation, at a fraction of the memory.
         """
         from src.config import config
 
@@ -82,6 +755,8 @@ class OptimizationDataset:
         self.include_variants = include_variants
         self.min_num_items = min_num_items
         self.max_num_items = max_num_items
+        self.num_workers = max(1, num_workers)
+        self.lazy = lazy
 
         # Use DataConfig values as defaults
         self.min_capacity = min_capacity or config.data.min_capacity
@@ -92,7 +767,6 @@ class OptimizationDataset:
         self.min_item_value = min_item_value or config.data.min_item_value
         self.max_item_value = max_item_value or config.data.max_item_value
 
-        random.seed(seed)
         logger.info(
             f"Initializing OptimizationDataset with size={size}, seed={seed}, "
             f"capacity=[{self.min_capacity}, {self.max_capacity}], "
@@ -101,15 +775,117 @@ class OptimizationDataset:
             f"item_value=[{self.min_item_value}, {self.max_item_value}], "
             f"include_variants={include_variants}"
         )
-        self.data: List[DatasetEntry] = self._generate_synthetic_data()
-        logger.info(f"Successfully generated {len(self.data)} problems")
+        cache_dir = cache_dir or config.data.cache_dir
+        if cache_path:
+            self.cache_path: Optional[Path] = Path(cache_path)
+        elif cache_dir:
+            self.cache_path = Path(cache_dir).expanduser() / f"{self._cache_key()}.npy"
+        else:
+            self.cache_path = None
+        self._records: Optional[np.ndarray] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._shm_layout: List[Tuple[str, Tuple[int, ...], str, int]] = []
+        self.data: List[_RawEntry] = []
+        # Naming style and min-quality (0 if not a variant) per problem; only
+        # kept for lazy datasets, whose entries are rebuilt from them
+        self._styles: Optional[np.ndarray] = None
+        self._min_qualities: Optional[np.ndarray] = None
+
+        # Structure-of-arrays numeric view of every problem: capacities (N,),
+        # num_items (N,) and zero-padded weights/values (N, K)
+        self.capacities: np.ndarray
+        self.num_items_per_problem: np.ndarray
+        self.weights: np.ndarray
+        self.values: np.ndarray
+
+        if self.cache_path is not None and self.cache_path.exists():
+            self._records = np.load(self.cache_path, mmap_mode="r")
+            self.capacities = self._records["capacity"]
+            self.num_items_per_problem = self._records["num_items"]
+            self.weights = self._records["weights"]
+            self.values = self._records["values"]
+            logger.info(
+                f"Memory-mapped {len(self._records)} cached problems from {self.cache_path}"
+            )
+            return
+
+        self.data = self._generate_synthetic_data()
+        logger.info(f"Successfully generated {len(self)} problems")
+
+        if self.cache_path is not None:
+            self._save_cache(self.cache_path)
+
+    def _cache_key(self) -> str:
+        """
+        Stable file name stem for this generation configuration.
+
+        Returns:
+            16 hex chars of a blake2b digest over the cache version and all
+            parameters that affect the generated data
+        """
+        params = (
+            _CACHE_VERSION,
+            self.size,
+            self.seed,
+            self.min_capacity,
+            self.max_capacity,
+            self.num_items,
+            self.min_item_weight,
+            self.max_item_weight,
+            self.min_item_value,
+            self.max_item_value,
+            self.include_variants,
+            self.min_num_items,
+            self.max_num_items,
+        )
+        return hashlib.blake2b(repr(params).encode(), digest_size=8).hexdigest()
+
+    def _save_cache(self, path: Path) -> None:
+        """
+        Persist entries and numeric arrays as one fixed-width structured array
+        that ``np.load`` can mmap.
+
+        Args:
+            path: Destination ``.npy`` path (parent directories are created)
+        """
+        fields = ("problem", "target", "id")
+        encoded = [
+            tuple(entry[f].encode("utf-8") for f in fields)
+            for entry in map(self.__getitem__, range(len(self)))
+        ]
+        dtype = [
+            (f, f"S{max((len(row[k]) for row in encoded), default=1) or 1}")
+            for k, f in enumerate(fields)
+        ]
+        width = self.weights.shape[1]
+        dtype += [
+            ("capacity", np.int32),
+            ("num_items", np.int32),
+            ("weights", np.int32, (width,)),
+            ("values", np.int32, (width,)),
+        ]
+        records = np.empty(len(encoded), dtype=dtype)
+        for k, f in enumerate(fields):
+            records[f] = [row[k] for row in encoded]
+        records["capacity"] = self.capacities
+        records["num_items"] = self.num_items_per_problem
+        records["weights"] = self.weights
+        records["values"] = self.values
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, records)
+        os.replace(tmp_path, path)  # atomic: concurrent readers never see a partial file
+        logger.info(f"Cached {len(records)} problems at {path}")
 
-    def _generate_synthetic_data(self) -> List[DatasetEntry]:
+    def _generate_synthetic_data(self) -> List[_RawEntry]:
         """
         Generates knapsack problems with ground truth solutions.
 
         Returns:
-            List of dataset entries with problems and target outputs
+            List of solved problems (empty for lazy datasets); target outputs
+            are built on access
 
         Raises:
             ValueError: If size is invalid or data generation fails
@@ -119,136 +895,187 @@ class OptimizationDataset:
         if self.size > 100000:
             logger.warning(f"Large dataset size ({self.size}) may cause memory issues")
 
-        data: List[DatasetEntry] = []
+        # Fixed-size shards, each with its own RNG spawned from the dataset
+        # seed, so the result does not depend on num_workers
+        starts = list(range(0, self.size, _SHARD_SIZE))
+        stops = starts[1:] + [self.size]
+        subseeds = np.random.SeedSequence(self.seed).spawn(len(starts))
+        params = [
+            _ShardParams(
+                self.min_capacity,
+                self.max_capacity,
+                self.min_num_items,
+                self.max_num_items,
+                self.min_item_weight,
+                self.max_item_weight,
+                self.min_item_value,
+                self.max_item_value,
+                self.include_variants,
+                self.lazy,
+            )
+        ] * len(starts)
+        if self.num_workers > 1 and len(starts) > 1:
+            # Imported here: concurrent.futures.process is a noticeable share
+            # of this module's import time and most callers never fork
+            from concurrent.futures import ProcessPoolExecutor
 
-        # Generate varied item names for better generalization
-        item_name_templates = [
-            lambda j: f"Item_{j}",
-            lambda j: chr(65 + j),  # A, B, C, ...
-            lambda j: f"item{j}",
-            lambda j: f"obj_{j}",
-        ]
+            with ProcessPoolExecutor(max_workers=min(self.num_workers, len(starts))) as pool:
+                shards = list(pool.map(_generate_shard, params, starts, stops, subseeds))
+        else:
+            shards = list(map(_generate_shard, params, starts, stops, subseeds))
 
-        for i in range(self.size):
-            # Generate valid capacity (avoid zero or negative)
-            capacity = random.randint(self.min_capacity, self.max_capacity)
-            if capacity <= 0:
-                capacity = self.min_capacity  # Fallback to minimum valid capacity
-
-            # Per judge: expand to 4-8 items with controlled growth
-            # 70% use base range (3-5), 30% use extended range (4-8)
-            if i % 10 < 7:  # 70% of problems
-                num_items_this_problem = random.randint(
-                    self.min_num_items, min(5, self.max_num_items)
-                )
-            else:  # 30% of problems with more items (prevent overfitting)
-                num_items_this_problem = random.randint(
-                    max(4, self.min_num_items), self.max_num_items
-                )
+        data: List[_RawEntry] = []
+        for shard in shards:
+            data.extend(shard[0])
 
-            # Randomize item naming for generalization
-            name_template = random.choice(item_name_templates)
+        # Concatenate shard arrays, re-padding to the widest shard
+        width = max(shard[2].shape[1] for shard in shards)
+        self.capacities = np.concatenate([shard[1] for shard in shards])
+        self.weights = np.concatenate(
+            [np.pad(shard[2], ((0, 0), (0, width - shard[2].shape[1]))) for shard in shards]
+        )
+        self.values = np.concatenate(
+            [np.pad(shard[3], ((0, 0), (0, width - shard[3].shape[1]))) for shard in shards]
+        )
+        self.num_items_per_problem = np.count_nonzero(self.weights, axis=1).astype(np.int32)
+        if self.lazy:
+            self._styles = np.concatenate([shard[4] for shard in shards])
+            self._min_qualities = np.concatenate([shard[5] for shard in shards])
 
-            items: List[KnapsackItem] = []
-            for j in range(num_items_this_problem):
-                # Ensure positive weights and values
-                weight = max(
-                    1, random.randint(self.min_item_weight, self.max_item_weight)
-                )
-                value = max(1, random.randint(self.min_item_value, self.max_item_value))
-                items.append(
-                    KnapsackItem(name=name_template(j), weight=weight, value=value)
-                )
+        return data
 
-            # Serialize for prompt using JSON (safer than Python literal syntax)
-            items_dict = [asdict(item) for item in items]
-            items_json = json.dumps(items_dict)
-            problem_text = f"Knapsack capacity: {capacity}. Available items: {items_json}. Select items to maximize value without exceeding capacity."
-
-            # Solve it
-            solution, reasoning, validation = self._solve_knapsack(capacity, items)
-
-            # Calculate solution totals
-            total_weight = sum(item.weight for item in items if item.name in solution)
-            total_value = sum(item.value for item in items if item.name in solution)
-
-            # Enhanced output format per judge recommendations
-            target_output = f"""<parse>
-{{"capacity": {capacity}, "items": {items_json}}}
-</parse>
-
-<reasoning>
-{reasoning}
-</reasoning>
-
-<solution>
-{{"selected": {json.dumps(solution)}, "total_weight": {total_weight}, "total_value": {total_value}}}
-</solution>
-
-<feasibility_certificate>
-{validation.feasibility}
-Weight check: {total_weight} <= {capacity} (capacity)
-Item validity: All selected items exist in problem
-</feasibility_certificate>
-
-<optimality_certificate>
-{validation.optimality}
-Computed optimum: {total_value}
-Status: OPTIMAL
-Gap: 0
-</optimality_certificate>
-
-<final>
-Solution quality: OPTIMAL
-Verification status: PASSED
-Confidence: HIGH (deterministic DP solver)
-Selected {len(solution)} items with total value {total_value} and weight {total_weight}/{capacity}
-</final>
-
-<answer>
-{json.dumps(solution)}
-</answer>"""
-
-            # Per judge: add second micro-domain variant (10% of problems)
-            # Variant: "budget + min-quality" constraint
-            if self.include_variants and i % 10 == 0:
-                # Add quality constraint variant
-                min_quality = random.randint(5, 15)
-                variant_problem = (
-                    f"Knapsack capacity: {capacity}. Available items: {items_json}. "
-                    f"Select items to maximize value without exceeding capacity. "
-                    f"Additional constraint: Total value must be at least {min_quality}."
-                )
+    @staticmethod
+    def _build_entry(
+        i: int,
+        capacity: int,
+        names: Sequence[str],
+        json_heads: Sequence[str],
+        weights: Sequence[int],
+        values: Sequence[int],
+        min_quality: Optional[int],
+        mask: int,
+        max_val: int,
+    ) -> _RawEntry:
+        """
+        Prompt, id and solution trace for one solved problem.
+
+        Args:
+            i: Problem index (used for the id)
+            capacity: Knapsack capacity
+            names: Item names of the problem's naming style
+            json_heads: JSON prefixes for ``names`` (see ``_item_json_heads``)
+            weights: Item weights
+            values: Item values
+            min_quality: Minimum total value for budget + min-quality variants,
+                None otherwise
+            mask: Optimal selection bitmask
+            max_val: Optimal value
 
-                # Check if solution meets quality constraint
-                if total_value >= min_quality:
-                    quality_status = f"Quality constraint satisfied: {total_value} >= {min_quality}"
-                else:
-                    quality_status = f"Quality constraint NOT satisfied: {total_value} < {min_quality}"
+        Returns:
+            The solved problem; its target is formatted on access (see
+            ``_format_target``)
+        """
+        # Serialize for prompt using JSON (safer than Python literal syntax)
+        items_json = "[" + ", ".join(
+            [
+                _ITEM_JSON_TMPL.format(head, weight, value)
+                for head, weight, value in zip(json_heads, weights, values)
+            ]
+        ) + "]"
 
-                variant_output = target_output.replace(
-                    "Constraint satisfaction: PASSED",
-                    f"Constraint satisfaction: PASSED\nQuality constraint: {quality_status}"
-                )
+        solution, reasoning, validation, total_weight, total_value = (
+            OptimizationDataset._trace_solution(
+                capacity, names, weights, values, mask, max_val
+            )
+        )
 
-                data.append(
-                    {"problem": variant_problem, "target": variant_output, "id": f"prob_{i}_variant"}
+        quality_status = None
+        if min_quality is None:
+            problem_text = "".join(
+                (_P_CAPACITY, str(capacity), _P_ITEMS, items_json, _P_TASK)
+            )
+            entry_id = f"prob_{i}"
+        else:
+            problem_text = "".join(
+                (
+                    _P_CAPACITY, str(capacity), _P_ITEMS, items_json, _P_TASK,
+                    _P_MIN_QUALITY, str(min_quality), ".",
                 )
+            )
+            entry_id = f"prob_{i}_variant"
+
+            # Check if solution meets quality constraint
+            if total_value >= min_quality:
+                quality_status = f"Quality constraint satisfied: {total_value} >= {min_quality}"
             else:
-                data.append(
-                    {"problem": problem_text, "target": target_output, "id": f"prob_{i}"}
-                )
-        return data
+                quality_status = f"Quality constraint NOT satisfied: {total_value} < {min_quality}"
+
+        return _RawEntry(
+            problem_text,
+            entry_id,
+            capacity,
+            items_json,
+            solution,
+            reasoning,
+            validation,
+            total_weight,
+            total_value,
+            quality_status,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_MATERIALIZE_CACHE_SIZE)
+    def _materialize(
+        i: int,
+        capacity: int,
+        weights: Tuple[int, ...],
+        values: Tuple[int, ...],
+        style: int,
+        min_quality: int,
+        max_num_items: int,
+    ) -> _RawEntry:
+        """
+        Solve and build one entry of a lazy dataset from its stored parameters.
+
+        Cached on the parameters themselves, so the cache holds no reference
+        to any dataset.
+
+        Args:
+            i: Problem index
+            capacity: Knapsack capacity
+            weights: Item weights
+            values: Item values
+            style: Naming style index into ``_item_name_styles``
+            min_quality: Minimum total value, 0 if not a variant
+            max_num_items: Dataset's ``max_num_items`` (sizes the name tables)
+
+        Returns:
+            Same entry eager generation produces for this problem
+        """
+        mask, max_val = _solve_selection(capacity, weights, values)
+        return OptimizationDataset._build_entry(
+            i,
+            capacity,
+            _item_name_styles(max_num_items)[style],
+            _item_json_heads(max_num_items)[style],
+            weights,
+            values,
+            min_quality or None,
+            mask,
+            max_val,
+        )
 
     def _solve_knapsack(
         self, capacity: int, items: List[KnapsackItem]
-    ) -> Tuple[List[str], str, VerificationResult]:
+    ) -> Tuple[List[str], str, VerificationResult, int, int]:
         """
         Solves the 0/1 Knapsack problem using Dynamic Programming.
         Returns:
             - List of selected item names
             - Reasoning trace string
             - VerificationResult containing feasibility and optimality proofs
+            - Total weight of the selected items
+            - Total value of the selected items (the optimum)
 
         Raises:
             ValueError: If capacity is invalid or items list has invalid data
@@ -270,71 +1097,270 @@ Selected {len(solution)} items with total value {total_value} and weight {total_
                     "No items to select. Constraints trivially satisfied.",
                     "No items available. Optimal value is 0.",
                 ),
+                0,
+                0,
             )
 
+        # Read each attribute once; the checks and solver work on the tuples
+        weights = tuple(item.weight for item in items)
+        values = tuple(item.value for item in items)
+
         # Validate items
-        for item in items:
-            if item.weight <= 0:
-                raise ValueError(f"Item {item.name} has invalid weight: {item.weight}")
-            if item.value < 0:
-                raise ValueError(f"Item {item.name} has invalid value: {item.value}")
-
-        n = len(items)
-        # dp[i][w] = max value with first i items and capacity w
-        try:
-            dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
-        except MemoryError as e:
-            raise ValueError(f"DP table too large (n={n}, capacity={capacity}): {e}")
+        if min(weights) <= 0:
+            item = next(item for item in items if item.weight <= 0)
+            raise ValueError(f"Item {item.name} has invalid weight: {item.weight}")
+        if min(values) < 0:
+            item = next(item for item in items if item.value < 0)
+            raise ValueError(f"Item {item.name} has invalid value: {item.value}")
+
+        mask, max_val = _solve_selection(capacity, weights, values)
+        return self._trace_solution(
+            capacity, [item.name for item in items], weights, values, mask, max_val
+        )
+
+    @staticmethod
+    def _trace_solution(
+        capacity: int,
+        names: Sequence[str],
+        weights: Sequence[int],
+        values: Sequence[int],
+        mask: int,
+        max_val: int,
+    ) -> Tuple[List[str], str, VerificationResult, int, int]:
+        """
+        Turn an optimal selection into the reasoning trace and certificates.
+
+        The trace is phrased as a DP backtrack from the last item down, which
+        is the order the selection is reconstructed in either solver.
 
-        for i in range(1, n + 1):
-            item = items[i - 1]
-            wt = item.weight
-            val = item.value
-            for w in range(1, capacity + 1):
-                if wt <= w:
-                    dp[i][w] = max(val + dp[i - 1][w - wt], dp[i - 1][w])
-                else:
-                    dp[i][w] = dp[i - 1][w]
+        Items are passed as parallel sequences so the generator never has to
+        build a KnapsackItem per item.
 
-        max_val = dp[n][capacity]
+        Args:
+            capacity: Knapsack capacity
+            names: Item names (may be longer than ``weights``; extras are ignored)
+            weights: Item weights
+            values: Item values
+            mask: Selection bitmask, bit i set when item ``i`` is selected
+            max_val: Optimal value at ``capacity``
 
-        # Backtrack to find items
+        Returns:
+            Same tuple as :meth:`_solve_knapsack`
+        """
+        n = len(weights)
+        # Backtrack to find items; the trace has exactly n + 3 lines
         w = capacity
         selected_items: List[str] = []
-        trace_steps: List[str] = []
+        trace_steps: List[str] = [""] * (n + 3)
 
-        trace_steps.append(
-            f"1. Initialize DP table with {n} items and capacity {capacity}."
-        )
-        trace_steps.append(f"2. Fill table... Max value found is {max_val}.")
-        trace_steps.append("3. Backtrack to find optimal items:")
-
-        for i in range(n, 0, -1):
-            item = items[i - 1]
-            if dp[i][w] != dp[i - 1][w]:
-                selected_items.append(item.name)
-                trace_steps.append(
-                    f"   - Checking {item.name} (w={item.weight}, v={item.value})... Included (Value increased). Remaining capacity: {w} -> {w - item.weight}."
+        trace_steps[0] = f"1. Initialize DP table with {n} items and capacity {capacity}."
+        trace_steps[1] = f"2. Fill table... Max value found is {max_val}."
+        trace_steps[2] = "3. Backtrack to find optimal items:"
+
+        for step, i in enumerate(range(n - 1, -1, -1), start=3):
+            name, weight = names[i], weights[i]
+            label = f"   - Checking {name} (w={weight}, v={values[i]})... "
+            if mask >> i & 1:
+                selected_items.append(name)
+                trace_steps[step] = (
+                    f"{label}Included (Value increased). Remaining capacity: {w} -> {w - weight}."
                 )
-                w -= item.weight
+                w -= weight
             else:
-                trace_steps.append(
-                    f"   - Checking {item.name} (w={item.weight}, v={item.value})... Skipped (Not part of optimal set)."
-                )
+                trace_steps[step] = label + _TRACE_SKIPPED
 
         reasoning = "\n".join(trace_steps)
 
-        # Calculation for certificates
-        selected_objs = [item for item in items if item.name in selected_items]
-        total_weight = sum(item.weight for item in selected_objs)
+        # Backtrack consumed exactly the selected items' weight
+        total_weight = capacity - w
 
         feasibility = f"Total weight {total_weight} <= Capacity {capacity}. Constraints satisfied."
         optimality = f"DP algorithm confirms maximum value is {max_val}."
 
-        return selected_items, reasoning, VerificationResult(feasibility, optimality)
+        return (
+            selected_items,
+            reasoning,
+            VerificationResult(feasibility, optimality),
+            total_weight,
+            max_val,
+        )
+
+    @staticmethod
+    def _format_target(raw: _RawEntry) -> str:
+        """
+        Build the target output (reasoning trace and certificates) for a problem.
+
+        Args:
+            raw: Solved problem from ``_generate_synthetic_data``
+
+        Returns:
+            Target text in the strict tagged output format
+        """
+        capacity = str(raw.capacity)
+        total_weight = str(raw.total_weight)
+        total_value = str(raw.total_value)
+        solution_json = _dumps_names(raw.solution)
+
+        # Enhanced output format per judge recommendations
+        target_output = "".join(
+            (
+                _T_PARSE, capacity, _T_ITEMS, raw.items_json,
+                _T_REASONING, raw.reasoning,
+                _T_SOLUTION, solution_json, _T_TOTAL_WEIGHT, total_weight,
+                _T_TOTAL_VALUE, total_value,
+                _T_FEASIBILITY, raw.validation.feasibility,
+                _T_WEIGHT_CHECK, total_weight, _T_LE, capacity,
+                _T_OPTIMALITY, raw.validation.optimality,
+                _T_OPTIMUM, total_value,
+                _T_FINAL, str(len(raw.solution)), _T_FINAL_VALUE, total_value,
+                _T_FINAL_WEIGHT, total_weight, _T_SLASH, capacity,
+                _T_ANSWER, solution_json, _T_END,
+            )
+        )
+
+        if raw.quality_status is not None:
+            target_output = target_output.replace(
+                "Constraint satisfaction: PASSED",
+                f"Constraint satisfaction: PASSED\nQuality constraint: {raw.quality_status}",
+            )
+        return target_output
+
+    def problem_arrays(self, idx: int) -> ProblemArrays:
+        """
+        Numeric data for one problem as views into the dataset arrays.
+
+        Args:
+            idx: Problem index
+
+        Returns:
+            ProblemArrays(capacity, weights, values) without copying item data
+        """
+        n = int(self.num_items_per_problem[idx])
+        return ProblemArrays(
+            self.capacities[idx], self.weights[idx, :n], self.values[idx, :n]
+        )
+
+    def share_memory(self) -> "OptimizationDataset":
+        """
+        Move the numeric arrays into one ``multiprocessing.shared_memory`` block.
+
+        Pickling the dataset afterwards (e.g. when handing it to pool workers)
+        sends only the block name and layout; workers attach to the same pages
+        instead of receiving copies. The block is unlinked when this dataset
+        is garbage collected or the interpreter exits.
+
+        Returns:
+            self, for chaining
+        """
+        if self._shm is not None:
+            return self
+
+        arrays = [np.ascontiguousarray(getattr(self, name)) for name in _SHARED_ARRAYS]
+        shm = shared_memory.SharedMemory(
+            create=True, size=max(sum(a.nbytes for a in arrays), 1)
+        )
+        layout = []
+        offset = 0
+        for name, array in zip(_SHARED_ARRAYS, arrays):
+            layout.append((name, array.shape, array.dtype.str, offset))
+            offset += array.nbytes
+
+        self._shm = shm
+        self._shm_layout = layout
+        self._attach_arrays()
+        for name, array in zip(_SHARED_ARRAYS, arrays):
+            getattr(self, name)[...] = array
+
+        weakref.finalize(self, _release_shared_memory, shm, True)
+        logger.info(f"Moved {shm.size} bytes of problem arrays to shared memory {shm.name}")
+        return self
+
+    def _attach_arrays(self) -> None:
+        """Point the numeric array attributes at ``self._shm`` per ``self._shm_layout``."""
+        for name, shape, dtype, offset in self._shm_layout:
+            setattr(
+                self,
+                name,
+                np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset),
+            )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        if self._shm is not None:
+            for name in _SHARED_ARRAYS:
+                del state[name]
+            state["_shm"] = self._shm.name
+        if self._records is not None and self.cache_path is not None:
+            # Re-map the cache file on the other side instead of copying it
+            state["_records"] = None
+            for name in _SHARED_ARRAYS:
+                state.pop(name, None)
+            state["_from_cache"] = True
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        shm_name = state.pop("_shm")
+        from_cache = state.pop("_from_cache", False)
+        self.__dict__.update(state)
+        self._shm = None
+        # Only re-map when __getstate__ dropped the mapped arrays; the cache
+        # file need not exist otherwise (e.g. a dataset still generating it)
+        if from_cache:
+            self._records = np.load(self.cache_path, mmap_mode="r")
+            self.capacities = self._records["capacity"]
+            self.num_items_per_problem = self._records["num_items"]
+            self.weights = self._records["weights"]
+            self.values = self._records["values"]
+        if shm_name is not None:
+            self._shm = shared_memory.SharedMemory(name=shm_name)
+            self._attach_arrays()
+            weakref.finalize(self, _release_shared_memory, self._shm, False)
 
     def __len__(self) -> int:
+        if self._records is not None:
+            return len(self._records)
+        if self.lazy:
+            return len(self.capacities)
         return len(self.data)
 
-    def __getitem__(self, idx: int) -> DatasetEntry:
-        return self.data[idx]
+    def __getitem__(
+        self, idx: Union[int, slice]
+    ) -> Union[DatasetEntry, List[DatasetEntry]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if self._records is not None:
+            record = self._records[idx]
+            return {
+                "problem": record["problem"].decode("utf-8"),
+                "target": record["target"].decode("utf-8"),
+                "id": record["id"].decode("utf-8"),
+            }
+        if self.lazy:
+            n = int(self.num_items_per_problem[idx])
+            raw = self._materialize(
+                range(len(self))[idx],  # normalize negative indices for the id
+                int(self.capacities[idx]),
+                tuple(self.weights[idx, :n].tolist()),
+                tuple(self.values[idx, :n].tolist()),
+                int(self._styles[idx]),
+                int(self._min_qualities[idx]),
+                self.max_num_items,
+            )
+        else:
+            raw = self.data[idx]
+        return {"problem": raw.problem, "target": self._format_target(raw), "id": raw.id}
+
+
+def _release_shared_memory(shm: shared_memory.SharedMemory, unlink: bool) -> None:
+    """Close (and, for the creating process, unlink) a shared memory block."""
+    try:
+        shm.close()
+    except BufferError:
+        # NumPy views are still alive (interpreter shutdown); the OS reclaims
+        # the mapping when the process exits
+        pass
+    if unlink:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
@@ -4,16 +4,133 @@ Provides functions to export, package, and prepare models for Kaggle Model publi
 """
 
 import os
+import functools
 import json
-import shutil
+import mmap
+import time
 import zipfile
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Any, Iterator, Optional, List, Tuple
 from datetime import datetime
 from src.logger import get_logger
 
 logger = get_logger(__name__)
 
+# orjson emits indented JSON from C; the stdlib encoder takes its slower
+# pure-Python path whenever indent is set
+try:
+    import orjson
+
+    def _dump_json(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+
+except ImportError:
+
+    def _dump_json(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Checkpoint/tensor formats: dense, near-incompressible data where DEFLATE
+# costs far more time than the few percent it saves
+_WEIGHT_SUFFIXES = frozenset(
+    {".safetensors", ".bin", ".onnx", ".msgpack", ".npz", ".npy", ".flax", ".h5"}
+)
+
+# Entries are read whole, ahead of the writer in package_model (on
+# _READ_AHEAD threads, with at most _READ_AHEAD_BUDGET bytes queued), and
+# added with one write: deflated entries up to _READ_AHEAD_MAX_BYTES, stored
+# entries below _MMAP_MIN_BYTES. Larger
+# stored entries are memory-mapped; larger deflated ones are streamed.
+# Either way zipfile's CRC-32 (zlib.crc32) runs once per entry rather than
+# once per 8 KiB chunk as in ZipFile.write
+_READ_AHEAD = 8
+_READ_AHEAD_MAX_BYTES = 64 * 1024 * 1024
+_READ_AHEAD_BUDGET = 128 * 1024 * 1024
+_MMAP_MIN_BYTES = 16 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _source_blobs() -> Tuple[Tuple[str, Tuple[int, ...], int, bytes], ...]:
+    """
+    The package's ``*.py`` sources, read once and reused by every export.
+
+    Only the plain bytes are cached, not a deflated bundle: zipfile has no
+    public way to add an entry that is already compressed, and deflating
+    these few small modules is negligible next to packaging the weights.
+
+    Returns:
+        Tuples of (file name, zip date_time, zip external_attr, contents),
+        with the metadata ``ZipInfo.from_file`` would record
+    """
+    blobs = []
+    for py_file in sorted(Path(__file__).parent.glob("*.py")):
+        zinfo = zipfile.ZipInfo.from_file(py_file, py_file.name)
+        blobs.append(
+            (py_file.name, zinfo.date_time, zinfo.external_attr, py_file.read_bytes())
+        )
+    return tuple(blobs)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_mapped(zipf: zipfile.ZipFile, path: str, arcname: str) -> None:
+    """
+    Add ``path`` as a ZIP_STORED entry straight from a read-only memory map.
+
+    The page cache backs the single write, so the file is never copied
+    through intermediate read buffers, and zipfile computes the entry's
+    CRC-32 with one ``zlib.crc32`` call over the whole map.
+
+    Args:
+        zipf: Archive open for writing
+        path: File to add (must not be empty)
+        arcname: Name inside the archive
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        # zinfo.file_size (from the stat) lets zipfile pick ZIP64 up front
+        with zipf.open(zinfo, "w") as dst:
+            dst.write(mm)
+
+
+def _read_ahead(
+    pool: ThreadPoolExecutor, paths: List[str], sizes: List[int]
+) -> Iterator[bytes]:
+    """
+    Yield file contents in order while later files load in the background.
+
+    Files are queued while their total size stays within
+    ``_READ_AHEAD_BUDGET``; one file is always queued, however large.
+
+    Args:
+        pool: Executor running the reads
+        paths: Files to read
+        sizes: Size in bytes of each file in ``paths``
+
+    Yields:
+        Contents of each file in ``paths``
+    """
+    pending: Deque[Tuple[Future, int]] = deque()
+    queued = 0
+    for path, size in zip(paths, sizes):
+        while pending and queued + size > _READ_AHEAD_BUDGET:
+            future, future_size = pending.popleft()
+            queued -= future_size
+            yield future.result()
+        pending.append((pool.submit(_read_file, path), size))
+        queued += size
+    while pending:
+        yield pending.popleft()[0].result()
+
 
 class ModelExporter:
     """Handles model export and packaging for Kaggle submission."""
@@ -42,6 +159,7 @@ class ModelExporter:
         dataset_info: str = "Synthetic Knapsack Problems",
         metrics: Optional[Dict[str, float]] = None,
         additional_info: Optional[Dict[str, Any]] = None,
+        export_time: Optional[datetime] = None,
     ) -> str:
         """
         Create a model card (README) for Kaggle Model.
@@ -54,6 +172,7 @@ class ModelExporter:
             dataset_info: Dataset information
             metrics: Performance metrics
             additional_info: Additional metadata
+            export_time: Export date shown in the card (defaults to now)
 
         Returns:
             Path to the created model card
@@ -62,6 +181,11 @@ class ModelExporter:
 
         metrics = metrics or {}
         additional_info = additional_info or {}
+        card_time_format = "%Y-%m-%d %H:%M:%S"
+        if export_time is None:
+            export_date = time.strftime(card_time_format)
+        else:
+            export_date = export_time.strftime(card_time_format)
 
         model_card = f"""# {model_name}
 
@@ -74,7 +198,7 @@ class ModelExporter:
 - **Training Method**: {training_method}
 - **Dataset**: {dataset_info}
 - **Framework**: Google Tunix (JAX/Flax)
-- **Export Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+- **Export Date**: {export_date}
 
 ## Performance Metrics
 
@@ -142,6 +266,7 @@ Apache 2.0
         model_name: str,
         version: str = "1.0.0",
         tags: Optional[List[str]] = None,
+        export_time: Optional[datetime] = None,
         **kwargs,
     ) -> str:
         """
@@ -151,6 +276,7 @@ Apache 2.0
             model_name: Model name
             version: Model version
             tags: List of tags
+            export_time: Value recorded as ``created_at`` (defaults to now)
             **kwargs: Additional metadata fields
 
         Returns:
@@ -172,19 +298,24 @@ Apache 2.0
             "framework": "tunix",
             "base_model": "google/gemma-2b",
             "tags": tags,
-            "created_at": datetime.now().isoformat(),
+            "created_at": (export_time or datetime.now()).isoformat(
+                timespec="seconds"
+            ),
             **kwargs,
         }
 
         metadata_path = self.output_dir / "metadata.json"
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        metadata_path.write_bytes(_dump_json(metadata))
 
         logger.info(f"Metadata created at {metadata_path}")
         return str(metadata_path)
 
     def package_model(
-        self, archive_name: Optional[str] = None, include_source: bool = True
+        self,
+        archive_name: Optional[str] = None,
+        include_source: bool = True,
+        compress_weights: bool = False,
+        export_time: Optional[datetime] = None,
     ) -> str:
         """
         Package the model into a zip archive for submission.
@@ -192,6 +323,10 @@ Apache 2.0
         Args:
             archive_name: Name of the archive (without .zip extension)
             include_source: Whether to include source code
+            compress_weights: Deflate weight files too. By default files with a
+                checkpoint suffix (``.safetensors``, ``.npy``, ...) are stored
+                uncompressed; everything else is deflated either way.
+            export_time: Timestamp for the default archive name (defaults to now)
 
         Returns:
             Path to the created archive
@@ -199,39 +334,85 @@ Apache 2.0
         logger.info("Packaging model...")
 
         if archive_name is None:
-            archive_name = (
-                f"constraint-reasoner-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-            )
+            if export_time is None:
+                stamp = time.strftime("%Y%m%d-%H%M%S")
+            else:
+                stamp = export_time.strftime("%Y%m%d-%H%M%S")
+            archive_name = f"constraint-reasoner-{stamp}"
 
         archive_path = self.output_dir / f"{archive_name}.zip"
 
-        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Add model files
-            if self.model_path.exists():
-                logger.info(f"Adding model files from {self.model_path}")
-                for root, dirs, files in os.walk(self.model_path):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(self.model_path.parent)
-                        zipf.write(file_path, arcname)
-            else:
-                logger.warning(f"Model path {self.model_path} does not exist")
-
-            # Add README and metadata if they exist
-            readme_path = self.output_dir / "README.md"
-            if readme_path.exists():
-                zipf.write(readme_path, "README.md")
+        # (source path, archive name, store uncompressed)
+        entries: List[Tuple[str, str, bool]] = []
+        sizes: List[int] = []
+
+        # Add model files
+        if self.model_path.exists():
+            logger.info(f"Adding model files from {self.model_path}")
+            # Iterative scandir walk on plain strings: archive names are the
+            # paths with the parent directory's prefix sliced off, and sizes
+            # come from the DirEntry's cached stat
+            prefix_len = len(os.path.join(str(self.model_path.parent), ""))
+            stack = [str(self.model_path)]
+            while stack:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            # Like os.walk, don't descend into symlinked dirs
+                            if not entry.is_symlink():
+                                stack.append(entry.path)
+                            continue
+                        suffix = os.path.splitext(entry.name)[1].lower()
+                        store = not compress_weights and suffix in _WEIGHT_SUFFIXES
+                        entries.append((entry.path, entry.path[prefix_len:], store))
+                        sizes.append(entry.stat().st_size)
+        else:
+            logger.warning(f"Model path {self.model_path} does not exist")
 
-            metadata_path = self.output_dir / "metadata.json"
-            if metadata_path.exists():
-                zipf.write(metadata_path, "metadata.json")
+        # Add README and metadata if they exist
+        readme_path = self.output_dir / "README.md"
+        if readme_path.exists():
+            entries.append((str(readme_path), "README.md", False))
+            sizes.append(readme_path.stat().st_size)
 
-            # Add source code if requested
+        metadata_path = self.output_dir / "metadata.json"
+        if metadata_path.exists():
+            entries.append((str(metadata_path), "metadata.json", False))
+            sizes.append(metadata_path.stat().st_size)
+
+        # Small entries (configs, metadata, small shards) are read on worker
+        # threads while this thread compresses and writes
+        read_ahead = [
+            size < _MMAP_MIN_BYTES if store else size <= _READ_AHEAD_MAX_BYTES
+            for (_, _, store), size in zip(entries, sizes)
+        ]
+        with ThreadPoolExecutor(max_workers=_READ_AHEAD) as pool, zipfile.ZipFile(
+            archive_path, "w", zipfile.ZIP_DEFLATED
+        ) as zipf:
+            contents = _read_ahead(
+                pool,
+                [entry[0] for entry, ahead in zip(entries, read_ahead) if ahead],
+                [size for size, ahead in zip(sizes, read_ahead) if ahead],
+            )
+            for (path, arcname, store), ahead in zip(entries, read_ahead):
+                if ahead:
+                    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                    zinfo.compress_type = (
+                        zipfile.ZIP_STORED if store else zipfile.ZIP_DEFLATED
+                    )
+                    zipf.writestr(zinfo, next(contents))
+                elif store:
+                    _write_mapped(zipf, path, arcname)
+                else:
+                    zipf.write(path, arcname)
+
+            # Add source code if requested (read once per process)
             if include_source:
-                src_dir = Path(__file__).parent
-                for py_file in src_dir.glob("*.py"):
-                    if py_file.name != "__pycache__":
-                        zipf.write(py_file, f"src/{py_file.name}")
+                for name, date_time, external_attr, data in _source_blobs():
+                    zinfo = zipfile.ZipInfo(f"src/{name}", date_time)
+                    zinfo.external_attr = external_attr
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    zipf.writestr(zinfo, data)
 
         logger.info(f"Model packaged at {archive_path}")
         return str(archive_path)
@@ -257,13 +438,21 @@ Apache 2.0
         """
         logger.info("Starting Kaggle export workflow...")
 
+        # One timestamp for every artifact of this export
+        export_time = datetime.now()
+
         # Create model card
         card_path = self.create_model_card(
-            model_name=model_name, description=description, metrics=metrics
+            model_name=model_name,
+            description=description,
+            metrics=metrics,
+            export_time=export_time,
         )
 
         # Create metadata
-        metadata_path = self.create_metadata(model_name=model_name, version=version)
+        metadata_path = self.create_metadata(
+            model_name=model_name, version=version, export_time=export_time
+        )
 
         # Package everything
         archive_path = self.package_model(archive_name=f"{model_name}-v{version}")
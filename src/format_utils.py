@@ -5,6 +5,10 @@ Defines the schema for:
 - Output (Reasoning + Certificates + Answer)
 """
 
+import functools
+import json
+from typing import Optional, Sequence, Tuple
+
 PROMPT_TEMPLATE = """
 You are a constraint optimization expert. Given the following problem, strictly follow this format:
 
@@ -40,6 +44,42 @@ Problem:
 {problem_text}
 """
 
+# orjson is optional: it parses JSON several times faster, and its
+# JSONDecodeError subclasses json.JSONDecodeError (and so ValueError), so
+# callers catch the same exceptions with either parser
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# The template's only placeholder, split around once so format_input is a
+# plain concatenation (same result as PROMPT_TEMPLATE.format)
+_PROMPT_HEAD, _PROMPT_TAIL = PROMPT_TEMPLATE.split("{problem_text}", 1)
+
+# Enhanced schema with all required tags per judge recommendations
+REQUIRED_TAGS = (
+    "parse",
+    "reasoning",
+    "solution",
+    "feasibility_certificate",
+    "optimality_certificate",
+    "final",
+    "answer",
+)
+
+# Longest model output parse_output accepts
+MAX_OUTPUT_LENGTH = 1024 * 1024  # 1MB
+
+# Outputs up to this length have their parse memoized
+_PARSE_CACHE_MAX_LENGTH = 64 * 1024
+
+# (open, close) markers per tag, built once; parse_output runs in tight
+# benchmark/reward loops
+_TAG_MARKERS = tuple((name, f"<{name}>", f"</{name}>") for name in REQUIRED_TAGS)
+_TAG_MARKERS_BY_NAME = {name: markers for name, *markers in _TAG_MARKERS}
+
 
 def format_input(problem_text: str) -> str:
     """
@@ -51,15 +91,64 @@ def format_input(problem_text: str) -> str:
     Returns:
         Formatted prompt string
     """
-    return PROMPT_TEMPLATE.format(problem_text=problem_text)
+    return _PROMPT_HEAD + problem_text + _PROMPT_TAIL
+
+
+def _find_tag(output_text: str, open_tag: str, close_tag: str) -> Optional[str]:
+    """
+    Stripped body of the first ``open_tag``...``close_tag`` span, or None.
+
+    Tags are literal markers, so two str.find calls replace the regex engine:
+    the body runs from the first opening tag to the next closing tag after it
+    (what a lazy ``<tag>(.*?)</tag>`` search matches).
+    """
+    start = output_text.find(open_tag)
+    if start == -1:
+        return None
+    start += len(open_tag)
+    end = output_text.find(close_tag, start)
+    return output_text[start:end].strip() if end != -1 else None
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_tags(output_text: str) -> Tuple[Optional[str], ...]:
+    """
+    Contents of every tag in REQUIRED_TAGS order (see parse_output).
+
+    Each tag is located independently, so tags may appear in any order and a
+    missing tag only yields None for that tag. One combined pattern with a
+    named group per tag would be a single match call, but it would impose the
+    template's order and fail as a whole on any missing tag; the per-tag
+    scans are str.find in C and already cost less than one regex pass.
+    """
+    return tuple(
+        _find_tag(output_text, open_tag, close_tag)
+        for _, open_tag, close_tag in _TAG_MARKERS
+    )
+
+
+def extract_tag(output_text: str, tag: str) -> Optional[str]:
+    """
+    Extract the contents of one tag from a model output.
 
+    Args:
+        output_text: The raw model output
+        tag: Tag name without brackets, e.g. ``"answer"``
 
-def parse_output(output_text: str) -> dict:
+    Returns:
+        Stripped contents of the first ``<tag>...</tag>`` span, or None if absent
+    """
+    return _find_tag(output_text, f"<{tag}>", f"</{tag}>")
+
+
+def parse_output(output_text: str, keys: Optional[Sequence[str]] = None) -> dict:
     """
     Parses the model output into components with enhanced schema validation.
 
     Args:
         output_text: The raw model output
+        keys: Only extract these tags (e.g. ``("answer",)`` on hot paths that
+            just gate verification on the answer); all tags if None
 
     Returns:
         Dictionary with keys: parse, reasoning, solution, feasibility_certificate,
@@ -71,35 +160,26 @@ def parse_output(output_text: str) -> dict:
         - final: Executive summary with verification status
 
     Raises:
-        ValueError: If output_text is too long (>1MB) to prevent ReDoS attacks
+        ValueError: If output_text is too long (>1MB)
+        KeyError: If ``keys`` names a tag outside REQUIRED_TAGS
     """
-    import re
-
-    # Prevent ReDoS attacks by limiting input size
-    MAX_OUTPUT_LENGTH = 1024 * 1024  # 1MB
+    # Checked before any scanning. Parsing is linear (at most two find scans
+    # per tag, no backtracking), so the cap bounds the work per call
     if len(output_text) > MAX_OUTPUT_LENGTH:
         raise ValueError(
             f"Output text too long: {len(output_text)} bytes (max: {MAX_OUTPUT_LENGTH})"
         )
 
-    # Enhanced schema with all required tags per judge recommendations
-    patterns = {
-        "parse": r"<parse>(.*?)</parse>",
-        "reasoning": r"<reasoning>(.*?)</reasoning>",
-        "solution": r"<solution>(.*?)</solution>",
-        "feasibility_certificate": r"<feasibility_certificate>(.*?)</feasibility_certificate>",
-        "optimality_certificate": r"<optimality_certificate>(.*?)</optimality_certificate>",
-        "final": r"<final>(.*?)</final>",
-        "answer": r"<answer>(.*?)</answer>",
-    }
-
-    results = {}
-    for key, pattern in patterns.items():
-        try:
-            match = re.search(pattern, output_text, re.DOTALL)
-            results[key] = match.group(1).strip() if match else None
-        except Exception as e:
-            # Log error but continue parsing other tags
-            results[key] = None
-
-    return results
+    if keys is not None:
+        return {
+            key: _find_tag(output_text, *_TAG_MARKERS_BY_NAME[key]) for key in keys
+        }
+
+    # Retries, Best-of-N groups and reward functions parse the same text
+    # repeatedly; cache the parsed tuple (not the dict, which callers may
+    # mutate) for typical-size outputs
+    if len(output_text) <= _PARSE_CACHE_MAX_LENGTH:
+        values = _parse_tags(output_text)
+    else:
+        values = _parse_tags.__wrapped__(output_text)
+    return dict(zip(REQUIRED_TAGS, values))
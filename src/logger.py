@@ -3,13 +3,40 @@ Logging utilities for Constraint Optimization Reasoner.
 Provides centralized logging configuration and utilities.
 """
 
+import functools
 import logging
 import sys
+import time
 from typing import Optional
 from pathlib import Path
 
 
-class ColoredFormatter(logging.Formatter):
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp only once."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, datefmt, formatted time); replaced as a whole, so formatters
+        # shared between handlers never see a half-updated entry
+        self._time_cache = (None, None, "")
+
+    def formatTime(self, record, datefmt=None):
+        # Log records arrive in bursts within the same second, and
+        # time.strftime dominates the cost of %(asctime)s; the output is the
+        # same as logging.Formatter.formatTime
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+            self._time_cache = (second, datefmt, formatted)
+        if datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """Custom formatter with colors for console output."""
 
     COLORS = {
@@ -21,10 +48,34 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once rather than per record
+        reset = self.COLORS["RESET"]
+        self._colored = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items()
+            if level != "RESET"
+        }
+
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
-        record.levelname = f"{log_color}{record.levelname}{self.COLORS['RESET']}"
-        return super().format(record)
+        levelname = record.levelname
+        colored = self._colored.get(levelname)
+        if colored is None:
+            colored = f"{self.COLORS['RESET']}{levelname}{self.COLORS['RESET']}"
+        # The record is shared with other handlers (e.g. a plain file handler),
+        # so the colored name is only swapped in while formatting
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+@functools.lru_cache(maxsize=None)
+def _console_formatter(log_format: str) -> ColoredFormatter:
+    """One shared console formatter per format string."""
+    return ColoredFormatter(log_format)
 
 
 def setup_logger(
@@ -49,18 +100,19 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
+    level_no = getattr(logging, level.upper())
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(level_no)
 
     # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+    if logger.handlers:
+        logger.handlers.clear()
 
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
-        console_formatter = ColoredFormatter(log_format)
-        console_handler.setFormatter(console_formatter)
+        console_handler.setLevel(level_no)
+        console_handler.setFormatter(_console_formatter(log_format))
         logger.addHandler(console_handler)
 
     # File handler
@@ -69,8 +121,8 @@ def setup_logger(
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_formatter = logging.Formatter(log_format)
+        file_handler.setLevel(level_no)
+        file_formatter = CachedTimeFormatter(log_format)
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
 
@@ -84,6 +136,8 @@ def get_logger(name: str) -> logging.Logger:
     """
     Get or create a logger with default configuration.
     Handles both direct imports (e.g., 'data_loader') and package imports (e.g., 'src.data_loader').
+    A logger is configured on its first request, unless :func:`setup_logger`
+    already gave it handlers.
 
     Args:
         name: Logger name (can be module.__name__)
@@ -91,10 +145,6 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance with proper configuration
     """
-    # Normalize logger name to handle both 'module' and 'src.module' formats
-    # Extract the base module name (last component)
-    base_name = name.split(".")[-1] if "." in name else name
-
     # Check if logger already exists with configuration
     logger = logging.getLogger(name)
 
@@ -104,24 +154,3 @@ def get_logger(name: str) -> logging.Logger:
 
     return logger
 
-
-# Create default loggers for each module (both direct and package import names)
-data_logger = setup_logger("data_loader")
-setup_logger("src.data_loader")  # Also configure package import name
-
-verifier_logger = setup_logger("verifiers")
-setup_logger("src.verifiers")
-
-inference_logger = setup_logger("inference_engine")
-setup_logger("src.inference_engine")
-
-rewards_logger = setup_logger("rewards")
-setup_logger("src.rewards")
-
-api_logger = setup_logger("api")
-setup_logger("deployment.app")
-
-# Configure other modules
-setup_logger("src.format_utils")
-setup_logger("src.validation")
-setup_logger("src.logger")
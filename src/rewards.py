@@ -3,14 +3,70 @@ Reward functions for GRPO training.
 Provides format, feasibility, and optimality reward functions.
 """
 
-from typing import List, Dict, Any
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from src.config import config
 from src.verifiers import Verifier
-from src.format_utils import parse_output
+from src.format_utils import json_loads, parse_output
 from src.logger import get_logger
 
 logger = get_logger(__name__)
 
-verifier = Verifier()
+# Numba is optional: it counts brevity tokens in one pass over the bytes
+# instead of building the list from str.split()
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=None)
+def _get_verifier() -> Verifier:
+    """The module's Verifier, built on first use (format/brevity never need it)."""
+    return Verifier()
+
+
+# The ASCII characters str.split() treats as whitespace (\t-\r, \x1c-\x1f, space)
+_ASCII_WHITESPACE = np.zeros(128, dtype=np.bool_)
+_ASCII_WHITESPACE[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+
+
+def preparse_completions(
+    completions: List[str],
+) -> List[Optional[Dict[str, Optional[str]]]]:
+    """
+    Parse every completion once, for sharing across reward functions.
+
+    Pass the result as ``_parsed=`` to :func:`format_reward_func`,
+    :func:`feasibility_reward_func` and :func:`optimality_reward_func` (or
+    ``parsed=`` to :func:`score_all`) so they skip their own parse.
+
+    Args:
+        completions: List of model completions
+
+    Returns:
+        One ``parse_output`` dictionary per completion, or None where the
+        completion is not a string or could not be parsed
+    """
+    parsed_all: List[Optional[Dict[str, Optional[str]]]] = []
+    for i, completion in enumerate(completions):
+        parsed = None
+        if isinstance(completion, str):
+            try:
+                parsed = parse_output(completion)
+            except Exception as e:
+                logger.warning(f"Completion {i}: Error parsing output: {e}")
+        parsed_all.append(parsed)
+    return parsed_all
 
 
 def format_reward_func(completions: List[str], **kwargs) -> List[float]:
@@ -19,7 +75,8 @@ def format_reward_func(completions: List[str], **kwargs) -> List[float]:
 
     Args:
         completions: List of model completions to evaluate
-        **kwargs: Additional arguments (unused)
+        **kwargs: Additional arguments; ``_parsed`` may hold the
+            :func:`preparse_completions` result for ``completions``
 
     Returns:
         List of rewards (1.0 for valid format, 0.0 for invalid)
@@ -34,6 +91,8 @@ def format_reward_func(completions: List[str], **kwargs) -> List[float]:
     if not isinstance(completions, list):
         raise ValueError(f"completions must be a list, got {type(completions)}")
 
+    preparsed = kwargs.get("_parsed")
+    debug = logger.isEnabledFor(logging.DEBUG)
     rewards = []
     for i, completion in enumerate(completions):
         if not isinstance(completion, str):
@@ -43,13 +102,21 @@ def format_reward_func(completions: List[str], **kwargs) -> List[float]:
 
         # Check for mandatory tags
         try:
-            parsed = parse_output(completion)
+            if preparsed is None:
+                parsed = parse_output(completion)
+            elif preparsed[i] is None:
+                rewards.append(0.0)  # preparse already logged the error
+                continue
+            else:
+                parsed = preparsed[i]
             if all(parsed.values()):
                 rewards.append(1.0)
-                logger.debug(f"Completion {i}: Format valid")
+                if debug:
+                    logger.debug(f"Completion {i}: Format valid")
             else:
                 rewards.append(0.0)  # Penalty for broken format
-                logger.debug(f"Completion {i}: Format invalid - missing tags")
+                if debug:
+                    logger.debug(f"Completion {i}: Format invalid - missing tags")
         except Exception as e:
             logger.warning(f"Completion {i}: Error parsing output: {e}")
             rewards.append(0.0)
@@ -58,91 +125,303 @@ def format_reward_func(completions: List[str], **kwargs) -> List[float]:
     return rewards
 
 
-def feasibility_reward_func(
-    prompts: List[str], completions: List[str], **kwargs
-) -> List[float]:
+# Prompts end with "Problem:\n{problem_text}" (see format_utils.PROMPT_TEMPLATE)
+_PROBLEM_MARKER = "Problem:\n"
+
+# Scores of the most recent score_all batch: (prompts, completions, scores).
+# GRPO calls each reward function on the same batch, so the feasibility and
+# optimality rewards share one parse/verify pass instead of running two
+_last_scores: Optional[
+    Tuple[Tuple[Any, ...], Tuple[Any, ...], Dict[str, np.ndarray]]
+] = None
+
+# Worker processes for parallel verification, kept across calls since
+# score_all runs every training step (see _verify_pool)
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+
+
+def _count_tokens_loops(buf: np.ndarray, whitespace: np.ndarray) -> int:
+    """Count runs of non-whitespace bytes in ``buf``, compiled by numba."""
+    count = 0
+    in_token = False
+    for b in buf:
+        if whitespace[b]:
+            in_token = False
+        elif not in_token:
+            in_token = True
+            count += 1
+    return count
+
+
+if NUMBA_AVAILABLE:
+    _count_tokens_compiled = njit(cache=True, nogil=True)(_count_tokens_loops)
+
+
+def _count_tokens(text: str) -> int:
+    """Whitespace token count of ``text``, equal to ``len(text.split())``."""
+    # Non-ASCII text may contain Unicode whitespace, which only str.split knows
+    if NUMBA_AVAILABLE and text.isascii():
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        return int(_count_tokens_compiled(buf, _ASCII_WHITESPACE))
+    return len(text.split())
+
+
+def _brevity_rewards(token_counts: np.ndarray) -> np.ndarray:
     """
-    Reward function that checks if the solution is feasible.
+    Brevity rewards for a batch of token counts, as one array computation.
+
+    Args:
+        token_counts: Tokens per completion; negative marks a completion
+            that could not be counted (not a string), which scores 0.0
+
+    Returns:
+        1.0 up to 512 tokens, falling linearly to 0.5 at 1024, 0.0 beyond
+    """
+    # Linear interpolation between 512 and 1024
+    interpolated = 1.0 - 0.5 * ((token_counts - 512) / 512)
+    return np.select(
+        [token_counts < 0, token_counts <= 512, token_counts <= 1024],
+        [0.0, 1.0, interpolated],
+        default=0.0,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _verify(problem_text: str, answer: str) -> Tuple[float, float]:
+    """
+    Feasibility and optimality rewards for one answer (memoized).
+
+    GRPO samples a group of completions per prompt, and converged or
+    degenerate policies repeat the same answer, so identical
+    (problem, answer) pairs recur within and across steps.
+
+    Args:
+        problem_text: Problem description
+        answer: Answer tag contents (JSON list of item names)
+
+    Returns:
+        Tuple of (feasibility reward, optimality reward)
+    """
+    verifier = _get_verifier()
+    feasibility = optimality = 0.0
+    try:
+        feasibility = 1.0 if verifier.verify_feasibility(problem_text, answer) else 0.0
+    except Exception as e:
+        logger.warning(f"Error in feasibility check: {e}")
+    try:
+        optimality = 1.0 if verifier.verify_optimality(problem_text, answer) else 0.0
+    except Exception as e:
+        logger.warning(f"Error in optimality check: {e}")
+    return feasibility, optimality
+
+
+def _answer_key(answer: str) -> Any:
+    """
+    Canonical form of an answer for deduplicating verifier calls.
+
+    Feasibility and optimality depend only on the multiset of selected names,
+    so answers listing the same names in another order or with other spacing
+    share a key (their sorted names). Anything else keys on the raw string.
+    """
+    try:
+        names = json_loads(answer)
+    except (ValueError, RecursionError):
+        return answer
+    if isinstance(names, list) and all(isinstance(name, str) for name in names):
+        return tuple(sorted(names))
+    return answer
+
+
+def _verify_pool(num_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool for :func:`_verify`, created on first use.
+
+    Workers start from a forkserver where available, so they import only this
+    module and its dependencies rather than forking a trainer that holds JAX
+    state. Each worker builds its verifier up front and keeps its own
+    ``_verify`` cache.
+
+    Args:
+        num_workers: Number of worker processes
+
+    Returns:
+        The shared executor (recreated if ``num_workers`` changed)
+    """
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != num_workers:
+        if _pool is not None:
+            _pool.shutdown()
+        mp_context = None
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("forkserver")
+        _pool = ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=mp_context, initializer=_get_verifier
+        )
+        _pool_workers = num_workers
+    return _pool
+
+
+def _extract_problem_text(prompt: str) -> Optional[str]:
+    """
+    Problem text of a prompt: what follows the first "Problem:" marker, up to
+    any second one, stripped. None if the prompt has no marker.
+    """
+    _, marker, rest = prompt.partition(_PROBLEM_MARKER)
+    if not marker:
+        return None
+    return rest.partition(_PROBLEM_MARKER)[0].strip()
+
+
+def score_all(
+    prompts: List[str],
+    completions: List[str],
+    num_workers: Optional[int] = None,
+    parsed: Optional[List[Optional[Dict[str, Optional[str]]]]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Compute every reward for a batch in a single pass.
+
+    Each completion is parsed once (``parse_output`` is itself memoized) and
+    each distinct (problem, answer) pair is verified once, where the
+    individual reward functions would each repeat the parse.
 
     Args:
         prompts: List of prompts
         completions: List of model completions
-        **kwargs: Additional arguments (unused)
+        num_workers: Processes used for verification (default:
+            ``config.rl.reward_num_workers``). With more than one, the distinct
+            (problem, answer) pairs are verified on a persistent process pool.
+        parsed: :func:`preparse_completions` result for ``completions``, used
+            instead of parsing them again
 
     Returns:
-        List of rewards (1.0 for feasible, 0.0 for infeasible)
+        Dictionary with "format", "feasibility", "optimality" and "brevity"
+        arrays of per-completion rewards (same values as the reward functions)
 
     Raises:
-        ValueError: If inputs are invalid or mismatched lengths
+        ValueError: If prompts and completions have different lengths
     """
-    if not prompts or not completions:
-        logger.warning("Empty prompts or completions list")
-        return []
-
     if len(prompts) != len(completions):
         raise ValueError(
             f"Prompts and completions length mismatch: {len(prompts)} vs {len(completions)}"
         )
+    if parsed is not None and len(parsed) != len(completions):
+        raise ValueError(
+            f"Parsed and completions length mismatch: "
+            f"{len(parsed)} vs {len(completions)}"
+        )
 
-    rewards = []
+    n = len(completions)
+    # Per-completion debug messages are only built when they will be emitted
+    debug = logger.isEnabledFor(logging.DEBUG)
+    problem_texts: Dict[str, Optional[str]] = {}
+    # (problem text, answer key) -> (answer verified, completion indices)
+    pairs: Dict[Tuple[str, Any], Tuple[str, List[int]]] = {}
+    scores = {key: np.zeros(n) for key in ("format", "feasibility", "optimality")}
+    token_counts = np.full(n, -1, dtype=np.int64)
     for i, (prompt, completion) in enumerate(zip(prompts, completions)):
-        if not isinstance(prompt, str) or not isinstance(completion, str):
-            logger.warning(
-                f"Completion {i}: Invalid types - prompt: {type(prompt)}, completion: {type(completion)}"
-            )
-            rewards.append(0.0)
+        if not isinstance(completion, str):
+            logger.warning(f"Completion {i} is not a string: {type(completion)}")
             continue
 
-        try:
-            parsed = parse_output(completion)
-        except Exception as e:
-            logger.warning(f"Completion {i}: Error parsing output: {e}")
-            rewards.append(0.0)
+        token_counts[i] = _count_tokens(completion)
+
+        if parsed is not None:
+            tags = parsed[i]
+            if tags is None:
+                continue  # preparse already logged the error
+        else:
+            try:
+                tags = parse_output(completion)
+            except Exception as e:
+                logger.warning(f"Completion {i}: Error parsing output: {e}")
+                continue
+
+        if all(tags.values()):
+            scores["format"][i] = 1.0
+
+        answer = tags["answer"]
+        if not answer:
+            if debug:
+                logger.debug(f"Completion {i}: No answer found")
             continue
 
-        if not parsed["answer"]:
-            rewards.append(0.0)
-            logger.debug(f"Completion {i}: No answer found")
+        if not isinstance(prompt, str):
+            logger.warning(f"Completion {i}: Invalid prompt type: {type(prompt)}")
             continue
 
-        # Extract problem text from prompt (assumes prompt format)
-        # Prompt: "... Problem:\n{problem_text}\n"
+        # A GRPO group repeats each prompt once per completion; extract its
+        # problem text only the first time it is seen
         try:
-            if "Problem:\n" not in prompt:
-                logger.warning(f"Completion {i}: Prompt missing 'Problem:' marker")
-                rewards.append(0.0)
-                continue
+            problem_text = problem_texts[prompt]
+        except KeyError:
+            problem_text = problem_texts[prompt] = _extract_problem_text(prompt)
+        if problem_text is None:
+            logger.warning(f"Completion {i}: Prompt missing 'Problem:' marker")
+            continue
 
-            problem_text = prompt.split("Problem:\n")[1].strip()
-            is_feasible = verifier.verify_feasibility(problem_text, parsed["answer"])
-            rewards.append(1.0 if is_feasible else 0.0)
-            logger.debug(f"Completion {i}: Feasible={is_feasible}")
-        except IndexError:
-            logger.warning(
-                f"Completion {i}: Failed to extract problem text from prompt"
-            )
-            rewards.append(0.0)
-        except Exception as e:
-            rewards.append(0.0)
-            logger.warning(f"Completion {i}: Error in feasibility check: {e}")
+        key = (problem_text, _answer_key(answer))
+        pairs.setdefault(key, (answer, []))[1].append(i)
 
-    logger.info(f"Feasibility rewards: {sum(rewards)}/{len(rewards)} feasible")
-    return rewards
+    scores["brevity"] = _brevity_rewards(token_counts)
 
+    if num_workers is None:
+        num_workers = config.rl.reward_num_workers
+    texts = [problem_text for problem_text, _ in pairs]
+    answers = [answer for answer, _ in pairs.values()]
+    if num_workers > 1 and len(pairs) > 1:
+        chunksize = max(1, len(pairs) // (4 * num_workers))
+        results = _verify_pool(num_workers).map(
+            _verify, texts, answers, chunksize=chunksize
+        )
+    else:
+        results = map(_verify, texts, answers)
 
-def optimality_reward_func(
+    for (_, indices), (feasibility, optimality) in zip(pairs.values(), results):
+        for i in indices:
+            scores["feasibility"][i] = feasibility
+            scores["optimality"][i] = optimality
+            if debug:
+                logger.debug(
+                    f"Completion {i}: Feasible={feasibility}, Optimal={optimality}"
+                )
+
+    return scores
+
+
+def _batch_scores(
+    prompts: List[str],
+    completions: List[str],
+    parsed: Optional[List[Optional[Dict[str, Optional[str]]]]] = None,
+) -> Dict[str, np.ndarray]:
+    """:func:`score_all` for this batch, reusing the last result if it matches."""
+    global _last_scores
+
+    key = (tuple(prompts), tuple(completions))
+    cached = _last_scores
+    if cached is not None and cached[:2] == key:
+        return cached[2]
+
+    scores = score_all(prompts, completions, parsed=parsed)
+    _last_scores = (*key, scores)
+    return scores
+
+
+def feasibility_reward_func(
     prompts: List[str], completions: List[str], **kwargs
 ) -> List[float]:
     """
-    Reward function that checks if the solution is optimal.
+    Reward function that checks if the solution is feasible.
 
     Args:
         prompts: List of prompts
         completions: List of model completions
-        **kwargs: Additional arguments (unused)
+        **kwargs: Additional arguments; ``_parsed`` may hold the
+            :func:`preparse_completions` result for ``completions``
 
     Returns:
-        List of rewards (1.0 for optimal, 0.0 for suboptimal)
+        List of rewards (1.0 for feasible, 0.0 for infeasible)
 
     Raises:
         ValueError: If inputs are invalid or mismatched lengths
@@ -151,51 +430,36 @@ def optimality_reward_func(
         logger.warning("Empty prompts or completions list")
         return []
 
-    if len(prompts) != len(completions):
-        raise ValueError(
-            f"Prompts and completions length mismatch: {len(prompts)} vs {len(completions)}"
-        )
+    scores = _batch_scores(prompts, completions, kwargs.get("_parsed"))
+    rewards = scores["feasibility"].tolist()
+    logger.info(f"Feasibility rewards: {sum(rewards)}/{len(rewards)} feasible")
+    return rewards
 
-    rewards = []
-    for i, (prompt, completion) in enumerate(zip(prompts, completions)):
-        if not isinstance(prompt, str) or not isinstance(completion, str):
-            logger.warning(
-                f"Completion {i}: Invalid types - prompt: {type(prompt)}, completion: {type(completion)}"
-            )
-            rewards.append(0.0)
-            continue
 
-        try:
-            parsed = parse_output(completion)
-        except Exception as e:
-            logger.warning(f"Completion {i}: Error parsing output: {e}")
-            rewards.append(0.0)
-            continue
+def optimality_reward_func(
+    prompts: List[str], completions: List[str], **kwargs
+) -> List[float]:
+    """
+    Reward function that checks if the solution is optimal.
 
-        if not parsed["answer"]:
-            rewards.append(0.0)
-            logger.debug(f"Completion {i}: No answer found")
-            continue
+    Args:
+        prompts: List of prompts
+        completions: List of model completions
+        **kwargs: Additional arguments; ``_parsed`` may hold the
+            :func:`preparse_completions` result for ``completions``
 
-        try:
-            if "Problem:\n" not in prompt:
-                logger.warning(f"Completion {i}: Prompt missing 'Problem:' marker")
-                rewards.append(0.0)
-                continue
+    Returns:
+        List of rewards (1.0 for optimal, 0.0 for suboptimal)
 
-            problem_text = prompt.split("Problem:\n")[1].strip()
-            is_optimal = verifier.verify_optimality(problem_text, parsed["answer"])
-            rewards.append(1.0 if is_optimal else 0.0)
-            logger.debug(f"Completion {i}: Optimal={is_optimal}")
-        except IndexError:
-            logger.warning(
-                f"Completion {i}: Failed to extract problem text from prompt"
-            )
-            rewards.append(0.0)
-        except Exception as e:
-            rewards.append(0.0)
-            logger.warning(f"Completion {i}: Error in optimality check: {e}")
+    Raises:
+        ValueError: If inputs are invalid or mismatched lengths
+    """
+    if not prompts or not completions:
+        logger.warning("Empty prompts or completions list")
+        return []
 
+    scores = _batch_scores(prompts, completions, kwargs.get("_parsed"))
+    rewards = scores["optimality"].tolist()
     logger.info(f"Optimality rewards: {sum(rewards)}/{len(rewards)} optimal")
     return rewards
 
@@ -227,28 +491,24 @@ def brevity_reward_func(completions: List[str], **kwargs) -> List[float]:
     if not isinstance(completions, list):
         raise ValueError(f"completions must be a list, got {type(completions)}")
 
-    rewards = []
+    token_counts = np.full(len(completions), -1, dtype=np.int64)
     for i, completion in enumerate(completions):
         if not isinstance(completion, str):
             logger.warning(f"Completion {i} is not a string: {type(completion)}")
-            rewards.append(0.0)
             continue
 
         # Simple token count approximation (whitespace split)
         # More accurate would use tokenizer, but this is fast and good enough
-        token_count = len(completion.split())
-
-        if token_count <= 512:
-            reward = 1.0
-        elif token_count <= 1024:
-            # Linear interpolation between 512 and 1024
-            reward = 1.0 - 0.5 * ((token_count - 512) / 512)
-        else:
-            reward = 0.0
+        token_counts[i] = _count_tokens(completion)
 
-        rewards.append(reward)
-        logger.debug(f"Completion {i}: {token_count} tokens, brevity reward={reward:.2f}")
+    rewards = _brevity_rewards(token_counts).tolist()
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, (token_count, reward) in enumerate(zip(token_counts, rewards)):
+            if token_count >= 0:
+                logger.debug(
+                    f"Completion {i}: {token_count} tokens, brevity reward={reward:.2f}"
+                )
 
-    avg_tokens = sum(len(c.split()) for c in completions) / len(completions)
+    avg_tokens = token_counts[token_counts >= 0].sum() / len(completions)
     logger.info(f"Brevity rewards: avg {avg_tokens:.0f} tokens, avg reward {sum(rewards)/len(rewards):.2f}")
     return rewards
@@ -7,6 +7,7 @@ import re
 import json
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from src.format_utils import extract_tag, json_loads
 from src.logger import get_logger
 
 logger = get_logger(__name__)
@@ -70,7 +71,7 @@ class ProblemValidator:
         else:
             try:
                 # Use JSON parsing for safety (per judge: avoid brittle parsing)
-                items = json.loads(items_match.group(1))
+                items = json_loads(items_match.group(1))
                 if not isinstance(items, list):
                     errors.append("Items must be a list")
                 elif len(items) == 0:
@@ -132,7 +133,7 @@ class ProblemValidator:
             return ValidationResult(False, errors, warnings)
 
         try:
-            solution = json.loads(solution_data)
+            solution = json_loads(solution_data)
             if not isinstance(solution, list):
                 errors.append("Solution must be a JSON list")
             else:
@@ -186,15 +187,14 @@ class OutputValidator:
         ]
 
         for tag in required_tags:
-            pattern = f"<{tag}>(.*?)</{tag}>"
-            match = re.search(pattern, output_text, re.DOTALL)
+            content = extract_tag(output_text, tag)
 
-            if not match:
+            if content is None:
                 if strict:
                     errors.append(f"Missing required tag: <{tag}>")
                 else:
                     warnings.append(f"Missing tag: <{tag}>")
-            elif not match.group(1).strip():
+            elif not content:
                 warnings.append(f"Tag <{tag}> is empty")
 
         is_valid = len(errors) == 0
@@ -9,6 +9,7 @@ Enhanced per judge recommendations:
 - False OPTIMAL claim detection and penalties
 """
 
+import functools
 import json
 import re
 import signal
@@ -16,6 +17,7 @@ from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 from src.logger import get_logger
 from src.config import config
+from src.format_utils import json_loads
 
 logger = get_logger(__name__)
 
@@ -58,6 +60,45 @@ def timeout_handler(signum, frame):
     raise TimeoutError("Verification timeout exceeded")
 
 
+@functools.lru_cache(maxsize=4096)
+def _knapsack_optimum(capacity: int, weights_values: Tuple[Tuple[Any, Any], ...]) -> int:
+    """
+    Exact 0/1 knapsack optimum via dynamic programming.
+
+    Memoized on the problem instance, so repeated verification of the same
+    problem (feasibility + optimality checks, retries, reward functions over a
+    GRPO group) solves the DP only once per process.
+
+    Args:
+        capacity: Knapsack capacity
+        weights_values: Tuple of (weight, value) pairs, one per item
+
+    Returns:
+        Maximum achievable value
+
+    Raises:
+        MemoryError: If the DP table cannot be allocated
+    """
+    n = len(weights_values)
+    dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
+
+    for i in range(1, n + 1):
+        wt, val = weights_values[i - 1]
+        # Index the two rows once per item; the conditional avoids a max() call
+        # per cell (>= keeps max()'s tie behaviour)
+        prev = dp[i - 1]
+        cur = dp[i]
+        for w in range(1, capacity + 1):
+            if wt <= w:
+                take = val + prev[w - wt]
+                skip = prev[w]
+                cur[w] = take if take >= skip else skip
+            else:
+                cur[w] = prev[w]
+
+    return dp[n][capacity]
+
+
 class Verifier:
     """
     Verifier class for constraint optimization solutions.
@@ -73,6 +114,22 @@ class Verifier:
         """
         self.timeout = timeout or config.verification.timeout_seconds
 
+    @staticmethod
+    def _compute_optimum(capacity: int, items: List[Dict[str, Any]]) -> int:
+        """
+        Compute the exact optimum for parsed problem items (memoized).
+
+        Args:
+            capacity: Knapsack capacity
+            items: Parsed item dictionaries with 'weight' and 'value'
+
+        Returns:
+            Maximum achievable value
+        """
+        return _knapsack_optimum(
+            capacity, tuple((item["weight"], item["value"]) for item in items)
+        )
+
     def _parse_problem(
         self, problem_text: str
     ) -> Tuple[Optional[int], Optional[List[Dict[str, Any]]]]:
@@ -106,7 +163,7 @@ class Verifier:
             return None, None
 
         try:
-            items = json.loads(items_match.group(1))
+            items = json_loads(items_match.group(1))
             if not isinstance(items, list):
                 logger.warning("Items is not a list")
                 return None, None
@@ -126,7 +183,7 @@ class Verifier:
             List of selected item names, or None if parsing fails
         """
         try:
-            selected_names = json.loads(solution_data)
+            selected_names = json_loads(solution_data)
         except json.JSONDecodeError as e:
             logger.warning(f"Solution is not valid JSON: {e}")
             return None
@@ -289,26 +346,15 @@ class Verifier:
                 # Zero capacity - only empty solution is optimal
                 optimal_value = 0
             else:
-                # Standard DP solution
+                # Standard DP solution (memoized per problem instance)
                 try:
-                    dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
+                    optimal_value = self._compute_optimum(capacity, items)
                 except MemoryError:
                     logger.error(
                         f"Memory allocation failed for DP table: {n}x{capacity+1}"
                     )
                     return False
 
-                for i in range(1, n + 1):
-                    wt = items[i - 1]["weight"]
-                    val = items[i - 1]["value"]
-                    for w in range(1, capacity + 1):
-                        if wt <= w:
-                            dp[i][w] = max(val + dp[i - 1][w - wt], dp[i - 1][w])
-                        else:
-                            dp[i][w] = dp[i - 1][w]
-
-                optimal_value = dp[n][capacity]
-
             # Calculate solution value with overflow protection
             item_map = {item["name"]: item for item in items}
             solution_value = 0
@@ -441,9 +487,8 @@ class Verifier:
         is_feasible = solution_weight <= capacity
 
         # Compute optimal value using DP
-        n = len(items)
         try:
-            dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
+            computed_optimum = self._compute_optimum(capacity, items)
         except MemoryError:
             logger.error("DP table too large")
             return DetailedVerificationResult(
@@ -458,17 +503,6 @@ class Verifier:
                 false_optimal_claim=False,
             )
 
-        for i in range(1, n + 1):
-            wt = items[i - 1]["weight"]
-            val = items[i - 1]["value"]
-            for w in range(1, capacity + 1):
-                if wt <= w:
-                    dp[i][w] = max(val + dp[i - 1][w - wt], dp[i - 1][w])
-                else:
-                    dp[i][w] = dp[i - 1][w]
-
-        computed_optimum = dp[n][capacity]
-
         # Determine optimality
         is_optimal = is_feasible and (solution_value == computed_optimum)
         gap = computed_optimum - solution_value if is_feasible else 0
@@ -1,6 +1,8 @@
 import pytest
 import json
 
+import numpy as np
+
 from src.data_loader import OptimizationDataset
 
 
@@ -57,9 +59,291 @@ def test_knapsack_solver_correctness():
     ]
     capacity = 10
 
-    selected, reasoning, certs = ds._solve_knapsack(capacity, items)
+    selected, reasoning, certs, total_weight, total_value = ds._solve_knapsack(
+        capacity, items
+    )
 
     assert "B" in selected
     assert "A" not in selected
     assert certs.feasibility is not None
     assert certs.optimality is not None
+    assert (total_weight, total_value) == (6, 12)
+
+
+def test_dataset_cache_roundtrip(tmp_path):
+    """Test that a cached dataset is memory-mapped back with identical entries."""
+    cache_path = tmp_path / "cache" / "ds.npy"
+
+    generated = OptimizationDataset(size=20, seed=7, cache_path=str(cache_path))
+    assert cache_path.exists()
+
+    cached = OptimizationDataset(size=20, seed=7, cache_path=str(cache_path))
+    assert len(cached) == len(generated)
+    assert [entry for entry in cached] == [entry for entry in generated]
+
+
+def test_dataset_slicing(tmp_path):
+    """Test that slicing returns formatted entries for every storage backend."""
+    cache_path = tmp_path / "dataset.npy"
+    datasets = [
+        OptimizationDataset(size=5, seed=8),
+        OptimizationDataset(size=5, seed=8, lazy=True),
+        OptimizationDataset(size=5, seed=8, cache_path=cache_path),
+    ]
+
+    for dataset in datasets:
+        assert dataset[0:2] == [dataset[0], dataset[1]]
+        assert dataset[::-2] == [dataset[4], dataset[2], dataset[0]]
+
+
+def test_dataset_problem_arrays(tmp_path):
+    """Test that numeric problem arrays match the problem text and survive caching."""
+    cache_path = tmp_path / "ds.npy"
+    ds = OptimizationDataset(size=10, seed=3, cache_path=str(cache_path))
+
+    for idx in range(len(ds)):
+        capacity, weights, values = ds.problem_arrays(idx)
+        problem = ds[idx]["problem"]
+        items = json.loads(problem.split("Available items: ")[1].split("]. ")[0] + "]")
+
+        assert f"Knapsack capacity: {capacity}." in problem
+        assert weights.tolist() == [item["weight"] for item in items]
+        assert values.tolist() == [item["value"] for item in items]
+        assert np.shares_memory(weights, ds.weights)
+
+    cached = OptimizationDataset(size=10, seed=3, cache_path=str(cache_path))
+    np.testing.assert_array_equal(cached.weights, ds.weights)
+    np.testing.assert_array_equal(cached.values, ds.values)
+    np.testing.assert_array_equal(cached.capacities, ds.capacities)
+
+
+def test_dataset_shared_memory_pickle():
+    """Test that a shared-memory dataset pickles by name and attaches to the same block."""
+    import pickle
+
+    ds = OptimizationDataset(size=10, seed=5).share_memory()
+    expected_weights = ds.weights.copy()
+
+    # Arrays travel by shared memory name, not by value
+    assert "weights" not in ds.__getstate__()
+
+    clone = pickle.loads(pickle.dumps(ds))
+    np.testing.assert_array_equal(clone.weights, expected_weights)
+    assert clone[3] == ds[3]
+
+    # Both objects see the same pages
+    ds.values[0, 0] = -1
+    assert clone.values[0, 0] == -1
+
+
+def test_knapsack_fill_kernels_agree():
+    """Test that the scalar (numba) and vectorized DP kernels give identical tables."""
+    from src.data_loader import _knapsack_fill_loops, _knapsack_fill_numpy
+
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        n = int(rng.integers(1, 9))
+        capacity = int(rng.integers(1, 60))
+        weights = rng.integers(1, 20, n).astype(np.int32)
+        values = rng.integers(0, 100, n).astype(np.int32)
+
+        keep_loops, best_loops = _knapsack_fill_loops(weights, values, capacity)
+        keep_numpy, best_numpy = _knapsack_fill_numpy(weights, values, capacity)
+
+        assert best_loops == best_numpy
+        np.testing.assert_array_equal(keep_loops, keep_numpy)
+
+
+def test_dataset_cache_dir_keys_by_config(tmp_path):
+    """Test that cache_dir derives distinct cache files per generation configuration."""
+    first = OptimizationDataset(size=5, seed=1, cache_dir=str(tmp_path))
+    other_seed = OptimizationDataset(size=5, seed=2, cache_dir=str(tmp_path))
+    other_items = OptimizationDataset(size=5, seed=1, max_num_items=5, cache_dir=str(tmp_path))
+
+    assert first.cache_path.parent == tmp_path
+    assert len({first.cache_path, other_seed.cache_path, other_items.cache_path}) == 3
+
+    reloaded = OptimizationDataset(size=5, seed=1, cache_dir=str(tmp_path))
+    assert reloaded.cache_path == first.cache_path
+    assert reloaded._records is not None
+    assert list(reloaded) == list(first)
+
+
+def test_knapsack_fill_batch_matches_single():
+    """Test that the batched DP fill matches per-problem fills on padded rows."""
+    from src.data_loader import _knapsack_fill_batch, _knapsack_fill_numpy, _unpack_keep
+
+    ds = OptimizationDataset(size=40, seed=11)
+    max_capacity = int(ds.capacities.max())
+    keep, dp = _knapsack_fill_batch(ds.weights, ds.values, max_capacity)
+
+    for p in range(len(ds)):
+        capacity, weights, values = ds.problem_arrays(p)
+        single_keep, best = _knapsack_fill_numpy(weights, values, int(capacity))
+        assert dp[p, capacity] == best
+        np.testing.assert_array_equal(
+            _unpack_keep(keep[p], int(capacity))[: len(weights)], single_keep
+        )
+
+
+def test_subset_enumeration_matches_dp_selection():
+    """Test that subset enumeration picks the same subset as the DP backtrack, ties included."""
+    from src.data_loader import _backtrack_mask, _best_subsets, _knapsack_fill_numpy
+
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        n = int(rng.integers(1, 9))
+        capacity = int(rng.integers(1, 30))
+        weights = rng.integers(1, 10, n).astype(np.int32)
+        values = rng.integers(1, 4, n).astype(np.int32)  # small range forces ties
+
+        masks, best = _best_subsets(weights[None, :], values[None, :], np.array([capacity]))
+        keep, dp_best = _knapsack_fill_numpy(weights, values, capacity)
+
+        assert best[0] == dp_best
+        assert masks[0] == _backtrack_mask(keep, weights, capacity)
+
+
+def test_dataset_generation_dp_path_for_many_items():
+    """Test that problems wider than the enumeration limit still solve via DP."""
+    ds = OptimizationDataset(size=30, seed=4, min_num_items=4, max_num_items=12)
+    assert ds.weights.shape[1] > 8
+
+    for entry in ds:
+        assert "<answer>" in entry["target"]
+
+
+def test_knapsack_fill_widens_dtype_for_large_values():
+    """Test that DP tables switch from int16 to int32 before values could overflow."""
+    from src.data_loader import _knapsack_fill_numpy
+
+    weights = np.array([1, 2, 3], dtype=np.int32)
+    values = np.array([20000, 20000, 20000], dtype=np.int32)
+
+    _, best = _knapsack_fill_numpy(weights, values, 6)
+    assert best == 60000
+
+
+def test_dataset_generation_leaves_global_rng_alone():
+    """Test that generation uses a local RNG instead of reseeding the random module."""
+    import random
+
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    OptimizationDataset(size=5, seed=9)
+    assert random.random() == expected
+
+
+def test_dataset_generation_parallel_shards(monkeypatch):
+    """Test that multi-process generation matches single-process generation."""
+    import src.data_loader as data_loader
+
+    monkeypatch.setattr(data_loader, "_SHARD_SIZE", 8)
+
+    serial = OptimizationDataset(size=25, seed=6)
+    parallel = OptimizationDataset(size=25, seed=6, num_workers=2)
+
+    assert len(parallel) == 25
+    assert list(parallel) == list(serial)
+    assert [entry["id"].split("_")[1] for entry in parallel] == [str(i) for i in range(25)]
+    np.testing.assert_array_equal(parallel.weights, serial.weights)
+
+
+def test_dataset_generation_parallel_shards_with_cache(tmp_path):
+    """Test that multi-process generation works when writing a new cache file."""
+    cache_path = tmp_path / "dataset.npy"
+
+    dataset = OptimizationDataset(size=9000, seed=2, cache_path=cache_path, num_workers=2)
+
+    assert cache_path.exists()
+    assert len(dataset) == 9000
+    assert dataset[8999] == OptimizationDataset(size=9000, seed=2)[8999]
+
+
+def test_specialized_enumerators_match_generic():
+    """Test that the generated small-n enumerators agree with the batched enumeration."""
+    from src.data_loader import _ENUMERATORS, _best_subsets
+
+    rng = np.random.default_rng(2)
+    for n, enumerate_items in _ENUMERATORS.items():
+        for _ in range(100):
+            capacity = int(rng.integers(1, 20))
+            weights = rng.integers(1, 10, n).astype(np.int32)
+            values = rng.integers(1, 4, n).astype(np.int32)
+
+            args = [int(x) for pair in zip(weights, values) for x in pair]
+            masks, best = _best_subsets(weights[None, :], values[None, :], np.array([capacity]))
+            assert enumerate_items(capacity, *args) == (masks[0], best[0])
+
+
+def test_lazy_dataset_matches_eager():
+    """Test that lazily materialized entries equal eagerly generated ones."""
+    import pickle
+
+    for kwargs in ({}, {"min_num_items": 4, "max_num_items": 12}):
+        eager = OptimizationDataset(size=30, seed=4, **kwargs)
+        lazy = OptimizationDataset(size=30, seed=4, lazy=True, **kwargs)
+
+        assert lazy.data == []
+        assert len(lazy) == len(eager)
+        assert list(lazy) == list(eager)
+        assert lazy[-1] == eager[29]
+        assert list(pickle.loads(pickle.dumps(lazy))) == list(eager)
+
+
+def test_lazy_dataset_from_cache_pickles(tmp_path):
+    """Test that a lazy dataset loaded from an existing cache survives pickling."""
+    import pickle
+
+    cache_path = tmp_path / "dataset.npy"
+    OptimizationDataset(size=6, seed=4, cache_path=cache_path)
+    dataset = OptimizationDataset(size=6, seed=4, cache_path=cache_path, lazy=True)
+
+    restored = pickle.loads(pickle.dumps(dataset))
+
+    assert list(restored) == list(dataset)
+    np.testing.assert_array_equal(restored.capacities, dataset.capacities)
+
+
+def test_solver_shortcuts_match_dp():
+    """Test the all-fit and nothing-fits shortcuts against the DP kernel."""
+    from src.data_loader import _knapsack_fill_numpy, _solve_selection
+
+    for capacity, weights, values in [
+        (30, (5, 6, 7, 8), (1, 2, 3, 4)),  # everything fits
+        (4, (5, 6, 7, 8), (1, 2, 3, 4)),  # nothing fits
+        (30, (5, 6, 7, 8), (1, 0, 3, 4)),  # fits, but a zero-value item is skipped
+    ]:
+        mask, best = _solve_selection(capacity, weights, values)
+        _, expected_best = _knapsack_fill_numpy(
+            np.array(weights, np.int32), np.array(values, np.int32), capacity
+        )
+        assert best == expected_best
+        assert sum(v for i, v in enumerate(values) if mask >> i & 1) == best
+        assert sum(w for i, w in enumerate(weights) if mask >> i & 1) <= capacity
+
+
+def test_solve_many_groups_by_capacity(monkeypatch):
+    """Test that capacity-grouped batched DP matches per-problem solving."""
+    import src.data_loader as data_loader
+
+    rng = np.random.default_rng(7)
+    size, width = 40, 10
+    num_items = rng.integers(9, width, size, endpoint=True)
+    present = np.arange(width) < num_items[:, None]
+    weights = np.where(present, rng.integers(1, 15, (size, width)), 0).astype(np.int32)
+    values = np.where(present, rng.integers(1, 50, (size, width)), 0).astype(np.int32)
+    capacities = rng.choice([12, 20, 35], size).astype(np.int32)
+
+    expected = [
+        data_loader._solve_selection(
+            int(c), tuple(w[:n].tolist()), tuple(v[:n].tolist())
+        )
+        for c, n, w, v in zip(capacities, num_items, weights, values)
+    ]
+    monkeypatch.setattr(data_loader, "NUMBA_AVAILABLE", False)
+    for max_groups in (64, 2):  # exact capacity groups, then capacity bands
+        monkeypatch.setattr(data_loader, "_DP_MAX_GROUPS", max_groups)
+        masks, best = data_loader._solve_many(capacities, num_items, weights, values)
+        assert list(zip(masks, best)) == expected
@@ -0,0 +1,121 @@
+"""
+Tests for export_utils module.
+"""
+
+import zipfile
+
+from src.export_utils import ModelExporter
+
+
+def _make_model_dir(tmp_path):
+    model_dir = tmp_path / "model"
+    (model_dir / "params").mkdir(parents=True)
+    (model_dir / "params" / "weights.safetensors").write_bytes(b"\x00" * 4096)
+    (model_dir / "config.json").write_text('{"layers": 2}' * 100)
+    return model_dir
+
+
+def test_package_model_stores_weights_uncompressed(tmp_path):
+    """Test that weight files are stored and other files deflated by default."""
+    exporter = ModelExporter(str(_make_model_dir(tmp_path)), str(tmp_path / "export"))
+    archive = exporter.package_model("bundle", include_source=False)
+
+    with zipfile.ZipFile(archive) as zipf:
+        infos = {info.filename: info for info in zipf.infolist()}
+        assert infos["model/params/weights.safetensors"].compress_type == zipfile.ZIP_STORED
+        assert infos["model/config.json"].compress_type == zipfile.ZIP_DEFLATED
+        assert zipf.read("model/params/weights.safetensors") == b"\x00" * 4096
+        assert zipf.testzip() is None
+
+
+def test_package_model_compress_weights(tmp_path):
+    """Test that compress_weights deflates weight files as well."""
+    exporter = ModelExporter(str(_make_model_dir(tmp_path)), str(tmp_path / "export"))
+    archive = exporter.package_model("bundle", include_source=False, compress_weights=True)
+
+    with zipfile.ZipFile(archive) as zipf:
+        info = zipf.getinfo("model/params/weights.safetensors")
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_package_model_includes_source(tmp_path):
+    """Test that README, metadata and sources are archived byte for byte."""
+    from pathlib import Path
+
+    import src.export_utils as export_utils
+
+    exporter = ModelExporter(str(_make_model_dir(tmp_path)), str(tmp_path / "export"))
+    exporter.create_metadata("test-model")
+    archive = exporter.package_model("bundle")
+
+    with zipfile.ZipFile(archive) as zipf:
+        assert zipf.testzip() is None
+        names = set(zipf.namelist())
+        assert "metadata.json" in names
+        source = Path(export_utils.__file__)
+        assert zipf.read(f"src/{source.name}") == source.read_bytes()
+
+
+def test_package_model_mmaps_large_weights(tmp_path, monkeypatch):
+    """Test that memory-mapped weight entries round-trip."""
+    import src.export_utils as export_utils
+
+    monkeypatch.setattr(export_utils, "_MMAP_MIN_BYTES", 1)
+    model_dir = _make_model_dir(tmp_path)
+    payload = bytes(range(256)) * 64
+    (model_dir / "params" / "weights.safetensors").write_bytes(payload)
+
+    exporter = ModelExporter(str(model_dir), str(tmp_path / "export"))
+    archive = exporter.package_model("bundle", include_source=False)
+
+    with zipfile.ZipFile(archive) as zipf:
+        info = zipf.getinfo("model/params/weights.safetensors")
+        assert info.compress_type == zipfile.ZIP_STORED
+        assert zipf.read(info) == payload
+        assert zipf.testzip() is None
+
+
+def test_read_ahead_caps_queued_bytes(tmp_path, monkeypatch):
+    """Test that read-ahead queues files by total size, not by file count."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import src.export_utils as export_utils
+
+    monkeypatch.setattr(export_utils, "_READ_AHEAD_BUDGET", 10)
+    paths = []
+    for i, size in enumerate([4, 4, 4, 12, 1]):
+        path = tmp_path / f"file{i}"
+        path.write_bytes(bytes([i]) * size)
+        paths.append(str(path))
+    sizes = [4, 4, 4, 12, 1]
+
+    submitted = []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        submit = pool.submit
+
+        def recording_submit(fn, path):
+            submitted.append(path)
+            return submit(fn, path)
+
+        monkeypatch.setattr(pool, "submit", recording_submit)
+        contents = export_utils._read_ahead(pool, paths, sizes)
+
+        assert next(contents) == b"\x00" * 4
+        # Files 0 and 1 fit the budget; file 2 waits until file 0 is taken
+        assert submitted == paths[:2]
+        assert list(contents) == [bytes([i]) * size for i, size in enumerate(sizes)][1:]
+
+
+def test_export_for_kaggle_uses_one_timestamp(tmp_path):
+    """Test that the card, metadata and archive share the export timestamp."""
+    import json
+
+    exporter = ModelExporter(str(_make_model_dir(tmp_path)), str(tmp_path / "export"))
+    artifacts = exporter.export_for_kaggle("reasoner", "Test model")
+
+    with open(artifacts["metadata"]) as f:
+        created_at = json.load(f)["created_at"]
+    with open(artifacts["model_card"]) as f:
+        card = f.read()
+    date, time = created_at.split("T")
+    assert f"**Export Date**: {date} {time}" in card
@@ -130,3 +130,57 @@ def test_format_input_with_special_characters():
 
     assert problem in formatted
     assert "Problem:" in formatted
+
+
+def test_parse_output_nested_and_repeated_tags():
+    """Test that each tag resolves to its first occurrence, even when nested."""
+    output = (
+        "<final><answer>[\"A\"]</answer></final>\n"
+        "<answer>[\"B\"]</answer>\n"
+        "<reasoning>first</reasoning><reasoning>second</reasoning>"
+    )
+    parsed = parse_output(output)
+
+    assert parsed["final"] == '<answer>["A"]</answer>'
+    assert parsed["answer"] == '["A"]'
+    assert parsed["reasoning"] == "first"
+    assert parsed["parse"] is None
+
+
+def test_format_input_matches_template():
+    """Test that format_input is equivalent to formatting the template."""
+    problem = 'Knapsack capacity: 7. Available items: [{"name": "A", "weight": 5, "value": 10}]'
+    assert format_input(problem) == PROMPT_TEMPLATE.format(problem_text=problem)
+
+
+def test_parse_output_returns_fresh_dicts():
+    """Test that cached parses hand out independent dictionaries."""
+    output = "<answer>\n[\"A\"]\n</answer>"
+    first = parse_output(output)
+    first["answer"] = "changed"
+
+    assert parse_output(output)["answer"] == '["A"]'
+
+
+def test_parse_output_selected_keys():
+    """Test that keys= restricts parsing to the requested tags."""
+    output = "<reasoning>r</reasoning>\n<answer>[\"A\"]</answer>"
+
+    assert parse_output(output, keys=("answer",)) == {"answer": '["A"]'}
+    assert parse_output(output, keys=("answer", "final")) == {
+        "answer": '["A"]',
+        "final": None,
+    }
+    with pytest.raises(KeyError):
+        parse_output(output, keys=("unknown",))
+
+
+def test_parse_output_tags_in_any_order():
+    """Test that tags are found independently of their order."""
+    output = "<answer>[\"A\"]</answer>\n<final>f</final>\n<reasoning>r</reasoning>"
+    parsed = parse_output(output)
+
+    assert parsed["answer"] == '["A"]'
+    assert parsed["final"] == "f"
+    assert parsed["reasoning"] == "r"
+    assert parsed["parse"] is None
@@ -8,7 +8,7 @@ import os
 
 # Import with error handling for JAX issues
 try:
-    from src.inference_engine import InferenceEngine, MockInference
+    from src.inference_engine import BatchScheduler, InferenceEngine, MockInference
 except (ImportError, RuntimeError, AttributeError) as e:
     pytest.skip(f"Cannot import inference_engine: {e}", allow_module_level=True)
 
@@ -104,6 +104,7 @@ def test_mock_inference_consistency():
         outputs = mock.generate(["test"])
         assert len(outputs) == 1
         assert '["Item_0"]' in outputs[0]
+        assert outputs[0] is MockInference.RESPONSE
 
 
 def test_inference_engine_verifier_integration():
@@ -122,3 +123,230 @@ def test_inference_engine_verifier_integration():
         # Verification should have been performed
         assert "feasible" in result["verification"]
         assert "optimal" in result["verification"]
+
+
+def test_inference_engine_solve_batch():
+    """Test batched solving returns one result per problem, in order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        non_existent_path = os.path.join(tmpdir, "non_existent_model")
+        engine = InferenceEngine(non_existent_path)
+
+        solvable = 'Knapsack capacity: 10. Available items: [{"name": "Item_0", "weight": 5, "value": 10}]'
+        # Mock always answers Item_0, which does not exist here
+        unsolvable = 'Knapsack capacity: 10. Available items: [{"name": "Other", "weight": 5, "value": 10}]'
+
+        results = engine.solve_batch([solvable, unsolvable, solvable], max_retries=2)
+
+        assert len(results) == 3
+        assert results[0]["verification"]["verified"] is True
+        assert results[0]["attempt"] == 1
+        assert results[1]["verification"]["verified"] is False
+        assert results[1]["attempt"] == 1  # best attempt kept, retries don't improve it
+        assert results[2]["verification"]["verified"] is True
+
+
+def test_inference_engine_solve_batches_retries():
+    """Test that retries after a failed first attempt share one generate call."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = InferenceEngine(os.path.join(tmpdir, "non_existent_model"))
+
+        calls = []
+        generate = engine.engine.generate
+
+        def counting_generate(prompts, **kwargs):
+            calls.append((len(prompts), kwargs))
+            return generate(prompts, **kwargs)
+
+        engine.engine.generate = counting_generate
+        # Mock always answers Item_0, which does not exist here
+        unsolvable = 'Knapsack capacity: 10. Available items: [{"name": "Other", "weight": 5, "value": 10}]'
+
+        result = engine.solve(unsolvable, max_retries=4)
+        assert calls == [(1, {}), (3, {"temperature": 0.7})]
+        assert result["attempt"] == 1
+
+        calls.clear()
+        engine.solve(unsolvable, max_retries=3, batched=False)
+        assert [n for n, _ in calls] == [1, 1, 1]
+
+
+def test_inference_engine_solve_overlap():
+    """Test that overlapping generation with verification keeps the results."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = InferenceEngine(os.path.join(tmpdir, "non_existent_model"))
+
+        solvable = 'Knapsack capacity: 10. Available items: [{"name": "Item_0", "weight": 5, "value": 10}]'
+        unsolvable = 'Knapsack capacity: 10. Available items: [{"name": "Other", "weight": 5, "value": 10}]'
+
+        for batched in (True, False):
+            result = engine.solve(solvable, batched=batched, overlap=True)
+            assert result["verification"]["verified"] is True
+            assert result["attempt"] == 1
+
+            result = engine.solve(unsolvable, batched=batched, overlap=True)
+            assert result == engine.solve(unsolvable, batched=batched)
+
+
+def test_inference_engine_solve_async():
+    """Test that solve_async returns the same result as solve."""
+    import asyncio
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = InferenceEngine(os.path.join(tmpdir, "non_existent_model"))
+        problem = 'Knapsack capacity: 10. Available items: [{"name": "Item_0", "weight": 5, "value": 10}]'
+
+        assert asyncio.run(engine.solve_async(problem)) == engine.solve(problem)
+
+
+def test_batch_scheduler_coalesces_requests():
+    """Test that concurrent submissions are served by one solve_batch call."""
+    import asyncio
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = InferenceEngine(os.path.join(tmpdir, "non_existent_model"))
+        solvable = 'Knapsack capacity: 10. Available items: [{"name": "Item_0", "weight": 5, "value": 10}]'
+        unsolvable = 'Knapsack capacity: 10. Available items: [{"name": "Other", "weight": 5, "value": 10}]'
+
+        batches = []
+        solve_batch = engine.solve_batch
+
+        def recording_solve_batch(problem_texts, **kwargs):
+            batches.append(list(problem_texts))
+            return solve_batch(problem_texts, **kwargs)
+
+        engine.solve_batch = recording_solve_batch
+
+        async def run():
+            scheduler = BatchScheduler(engine, max_batch_size=4, max_delay_ms=200)
+            scheduler.start()
+            try:
+                return await asyncio.gather(
+                    scheduler.submit(solvable),
+                    scheduler.submit(unsolvable),
+                    scheduler.submit(solvable),
+                )
+            finally:
+                await scheduler.stop()
+
+        results = asyncio.run(run())
+        assert batches == [[solvable, unsolvable, solvable]]
+        assert [r["verification"]["verified"] for r in results] == [True, False, True]
+
+
+def test_batch_scheduler_submit_requires_start():
+    """Test that submitting to a scheduler that was never started fails clearly."""
+    import asyncio
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = InferenceEngine(os.path.join(tmpdir, "non_existent_model"))
+        scheduler = BatchScheduler(engine)
+
+        with pytest.raises(RuntimeError, match="start"):
+            asyncio.run(scheduler.submit("problem"))
+
+
+def test_batch_scheduler_stop_fails_pending_requests():
+    """Test that stop() fails in-flight and queued requests instead of hanging."""
+    import asyncio
+    import threading
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = InferenceEngine(os.path.join(tmpdir, "non_existent_model"))
+        release = threading.Event()
+        batches = []
+
+        def blocking_solve_batch(problem_texts, **kwargs):
+            batches.append(list(problem_texts))
+            release.wait(5)
+            return [{} for _ in problem_texts]
+
+        engine.solve_batch = blocking_solve_batch
+
+        async def run():
+            scheduler = BatchScheduler(engine, max_batch_size=1, max_delay_ms=0)
+            scheduler.start()
+            inflight = asyncio.ensure_future(scheduler.submit("first"))
+            while not batches:
+                await asyncio.sleep(0.01)
+            queued = asyncio.ensure_future(scheduler.submit("second"))
+            await asyncio.sleep(0)
+
+            await scheduler.stop()
+            release.set()
+            return await asyncio.gather(inflight, queued, return_exceptions=True)
+
+        results = asyncio.run(run())
+        assert batches == [["first"]]
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_inference_engine_solve_best_of():
+    """Test Best-of-N: one sampled batch, shortest verified answer wins."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = InferenceEngine(os.path.join(tmpdir, "non_existent_model"))
+        problem = (
+            'Knapsack capacity: 10. Available items: [{"name": "A", "weight": 5, "value": 10}, '
+            '{"name": "B", "weight": 5, "value": 10}, {"name": "C", "weight": 10, "value": 20}]'
+        )
+        outputs = ['<answer>["A", "B"]</answer>', "no answer", '<answer>["C"]</answer>']
+        calls = []
+
+        def fake_generate(prompts, **kwargs):
+            calls.append((len(prompts), kwargs))
+            return outputs[: len(prompts)]
+
+        engine.engine.generate = fake_generate
+
+        result = engine.solve(problem, max_retries=3, best_of=3)
+        assert calls == [(3, {"temperature": 0.7})]
+        assert result["attempt"] == 3
+        assert result["parsed"]["answer"] == '["C"]'
+        assert result["verification"]["verified"] is True
+
+
+def test_inference_engine_solve_skips_unparseable_candidates():
+    """Test that an oversized output in a batched round does not abort solve()."""
+    from src.format_utils import MAX_OUTPUT_LENGTH
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = InferenceEngine(os.path.join(tmpdir, "non_existent_model"))
+        problem = 'Knapsack capacity: 10. Available items: [{"name": "A", "weight": 5, "value": 10}]'
+        outputs = ["x" * (MAX_OUTPUT_LENGTH + 1), None, '<answer>["A"]</answer>']
+
+        def fake_generate(prompts, **kwargs):
+            return outputs[: len(prompts)]
+
+        engine.engine.generate = fake_generate
+
+        result = engine.solve(problem, max_retries=3, best_of=3)
+        assert result["attempt"] == 3
+        assert result["verification"]["verified"] is True
+
+
+def test_inference_engine_solve_batch_streaming():
+    """Test that generate_stream outputs are consumed as they arrive."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = InferenceEngine(os.path.join(tmpdir, "non_existent_model"))
+        solvable = 'Knapsack capacity: 10. Available items: [{"name": "Item_0", "weight": 5, "value": 10}]'
+        unsolvable = 'Knapsack capacity: 10. Available items: [{"name": "Other", "weight": 5, "value": 10}]'
+
+        class StreamingEngine:
+            def __init__(self):
+                self.batches = []
+
+            def generate_stream(self, prompts, **kwargs):
+                self.batches.append(len(prompts))
+                # Completions finish out of order; in the first batch the
+                # last one never does
+                returned = len(prompts) - 1 if len(self.batches) == 1 else len(prompts)
+                for pos in reversed(range(returned)):
+                    yield pos, MockInference.RESPONSE
+
+        engine.engine = StreamingEngine()
+        results = engine.solve_batch([unsolvable, solvable, solvable], max_retries=2)
+
+        # Attempt 2 retries the unsolvable problem and the one never returned
+        assert engine.engine.batches == [3, 2]
+        assert [r["verification"]["verified"] for r in results] == [False, True, True]
+        assert results[1]["attempt"] == 1
+        assert results[2]["attempt"] == 2
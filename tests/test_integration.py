@@ -122,6 +122,17 @@ class TestEndToEndIntegration:
         assert metrics.optimality_rate == 100.0
         assert metrics.false_optimal_claims == 0
     
+    def test_benchmark_parallel_matches_serial(self):
+        """
+        Test process-pool verification gives the same metrics as in-process.
+        """
+        benchmark = BenchmarkSuite(size=50, seed=123)
+
+        serial = benchmark.run_benchmark(inference_fn=None, num_workers=1)
+        parallel = benchmark.run_benchmark(inference_fn=None, num_workers=2)
+
+        assert parallel == serial
+    
     def test_diversified_dataset(self):
         """
         Test dataset diversification (3-8 items, variants).
@@ -10,6 +10,8 @@ from src.rewards import (
     feasibility_reward_func,
     optimality_reward_func,
     brevity_reward_func,
+    preparse_completions,
+    score_all,
 )
 
 
@@ -221,3 +223,132 @@ def test_brevity_reward_func_multiple():
     assert rewards[0] == 1.0
     assert 0.0 < rewards[1] < 1.0
     assert rewards[2] == 0.0
+
+
+def test_score_all_matches_reward_functions():
+    """Test that score_all computes the same rewards as each reward function."""
+    problem = (
+        'Knapsack capacity: 10. Available items: [{"name": "A", "weight": 5, "value": 10}, '
+        '{"name": "B", "weight": 6, "value": 12}]'
+    )
+    prompts = [f"Solve this.\nProblem:\n{problem}\n"] * 4 + ["No marker here"]
+    body = """<reasoning>R</reasoning>
+<feasibility_certificate>F</feasibility_certificate>
+<optimality_certificate>O</optimality_certificate>
+"""
+    completions = [
+        body + '<answer>["B"]</answer>',
+        body + '<answer>["A"]</answer>',
+        body + '<answer>["A", "B"]</answer>',
+        "<answer>not json</answer>",
+        body + '<answer>["B"]</answer>',
+    ]
+
+    scores = score_all(prompts, completions)
+
+    assert scores["format"].tolist() == format_reward_func(completions)
+    assert scores["feasibility"].tolist() == [1.0, 1.0, 0.0, 0.0, 0.0]
+    assert scores["optimality"].tolist() == [1.0, 0.0, 0.0, 0.0, 0.0]
+    assert scores["brevity"].tolist() == brevity_reward_func(completions)
+    assert feasibility_reward_func(prompts, completions) == scores["feasibility"].tolist()
+    assert optimality_reward_func(prompts, completions) == scores["optimality"].tolist()
+
+    with pytest.raises(ValueError):
+        score_all(prompts, completions[:2])
+
+
+def test_score_all_verifies_repeated_answers_once(monkeypatch):
+    """Test that identical (problem, answer) pairs hit the solver once."""
+    import src.rewards as rewards
+
+    calls = []
+    verifier = rewards._get_verifier()
+    verify_feasibility = verifier.verify_feasibility
+
+    def counting_verify_feasibility(problem_text, answer):
+        calls.append(answer)
+        return verify_feasibility(problem_text, answer)
+
+    monkeypatch.setattr(verifier, "verify_feasibility", counting_verify_feasibility)
+    rewards._verify.cache_clear()
+
+    prompts = ['Problem:\nKnapsack capacity: 7. Available items: [{"name": "A", "weight": 5, "value": 10}]'] * 3
+    completions = ['<answer>["A"]</answer>', '<answer>["A"]</answer>', "<answer>[]</answer>"]
+
+    assert score_all(prompts, completions)["feasibility"].tolist() == [1.0, 1.0, 1.0]
+    assert calls == ['["A"]', "[]"]
+
+    calls.clear()
+    prompts = ['Problem:\nKnapsack capacity: 7. Available items: [{"name": "A", "weight": 5, "value": 10}, {"name": "B", "weight": 1, "value": 1}]'] * 2
+    completions = ['<answer>["A", "B"]</answer>', '<answer>["B","A"]</answer>']
+    assert score_all(prompts, completions)["feasibility"].tolist() == [1.0, 1.0]
+    assert calls == ['["A", "B"]']
+
+
+def test_count_tokens_matches_str_split():
+    """Test that the byte-level token counter agrees with str.split."""
+    import numpy as np
+
+    from src.rewards import _ASCII_WHITESPACE, _count_tokens, _count_tokens_loops
+
+    assert _ASCII_WHITESPACE.tolist() == [chr(c).isspace() for c in range(128)]
+    texts = ["", "   ", "one", " two  words ", "a\tb\nc\x0bd\x0ce\rf\x1cg\x1fh", "x" * 50 + " y"]
+    for text in texts:
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        assert _count_tokens_loops(buf, _ASCII_WHITESPACE) == len(text.split())
+        assert _count_tokens(text) == len(text.split())
+    assert _count_tokens("a b　c") == 3
+
+
+def test_extract_problem_text():
+    """Test problem text extraction against the split-based definition."""
+    from src.rewards import _extract_problem_text
+
+    for prompt in ["Solve.\nProblem:\n text \n", "Problem:\na\nProblem:\nb", "Problem:\n"]:
+        assert _extract_problem_text(prompt) == prompt.split("Problem:\n")[1].strip()
+    assert _extract_problem_text("no marker") is None
+
+
+def test_score_all_parallel_matches_serial():
+    """Test that verifying on worker processes gives the serial scores."""
+    problem = 'Knapsack capacity: 10. Available items: [{"name": "A", "weight": 5, "value": 10}, {"name": "B", "weight": 6, "value": 12}]'
+    prompts = [f"Problem:\n{problem}"] * 4
+    completions = [
+        '<answer>["B"]</answer>',
+        '<answer>["A"]</answer>',
+        '<answer>["A", "B"]</answer>',
+        '<answer>["B"]</answer>',
+    ]
+
+    serial = score_all(prompts, completions, num_workers=1)
+    parallel = score_all(prompts, completions, num_workers=2)
+
+    for key in serial:
+        assert parallel[key].tolist() == serial[key].tolist()
+
+
+def test_preparsed_completions_give_same_rewards(monkeypatch):
+    """Test that reward functions reuse a shared preparse instead of parsing."""
+    import src.rewards as rewards
+
+    prompts = ['Problem:\nKnapsack capacity: 7. Available items: [{"name": "A", "weight": 5, "value": 10}]'] * 3
+    completions = ['<answer>["A"]</answer>', "<answer>[]</answer>", "no tags"]
+    expected = (
+        format_reward_func(completions),
+        feasibility_reward_func(prompts, completions),
+        optimality_reward_func(prompts, completions),
+    )
+
+    parsed = preparse_completions(completions)
+    assert parsed[0]["answer"] == '["A"]'
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parse_output called despite _parsed")
+
+    monkeypatch.setattr(rewards, "parse_output", fail)
+    monkeypatch.setattr(rewards, "_last_scores", None)
+    assert (
+        format_reward_func(completions, _parsed=parsed),
+        feasibility_reward_func(prompts, completions, _parsed=parsed),
+        optimality_reward_func(prompts, completions, _parsed=parsed),
+    ) == expected